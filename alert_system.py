@@ -1,32 +1,84 @@
 import streamlit as st
 from datetime import datetime
 
+def _check_threshold(sensor_name, value, threshold, direction):
+    """Directional threshold check shared by the high/low alert types.
+
+    direction is +1.0 for high thresholds and -1.0 for low ones, so the
+    hot comparison is a single sign test; the message branch only runs
+    when an alert actually triggers.
+    """
+    if (value - threshold) * direction > 0:
+        if direction > 0:
+            return f"{sensor_name} value {value} exceeds threshold {threshold}"
+        return f"{sensor_name} value {value} is below threshold {threshold}"
+    return None
+
+def _check_threshold_high(sensor_name, value, threshold):
+    """Return an alert message if the value exceeds the threshold"""
+    return _check_threshold(sensor_name, value, threshold, 1.0)
+
+def _check_threshold_low(sensor_name, value, threshold):
+    """Return an alert message if the value is below the threshold"""
+    return _check_threshold(sensor_name, value, threshold, -1.0)
+
+def _check_change_rate(sensor_name, value, threshold):
+    """Check the rate of change against the threshold"""
+    # For change rate alerts, we need previous data
+    # This is a simplified implementation
+    return None
+
 class AlertSystem:
     """System for defining and checking sensor alerts"""
-    
+
+    # Check function per alert type; resolved once per config in
+    # add_alert_config so check_alerts is a plain lookup-and-call
+    _CHECKS = {
+        'Threshold High': _check_threshold_high,
+        'Threshold Low': _check_threshold_low,
+        'Change Rate': _check_change_rate,
+    }
+
     def __init__(self):
         """Initialize the alert system"""
         # Alert configs stored as a list of dictionaries with sensor_id, type, threshold, etc.
         self.alert_configs = []
-    
+        # Index of alert configs bucketed by sensor_id so check_alerts only
+        # inspects the configs for the sensor being checked
+        self._by_sensor = {}
+
     def add_alert_config(self, config):
         """Add a new alert configuration"""
         if not isinstance(config, dict):
             raise ValueError("Alert configuration must be a dictionary")
-        
+
         required_fields = ['sensor_id', 'type', 'threshold']
         for field in required_fields:
             if field not in config:
                 raise ValueError(f"Alert config missing required field: {field}")
-        
+
+        # Resolve the check function now so unknown alert types fail at
+        # configuration time instead of inside the check loop
+        if config['type'] not in self._CHECKS:
+            raise ValueError(f"Unknown alert type: {config['type']}")
+        config['_check'] = self._CHECKS[config['type']]
+
         # Add the alert config
         self.alert_configs.append(config)
+        self._by_sensor.setdefault(config['sensor_id'], []).append(config)
         return True
-    
+
     def remove_alert_config(self, index):
         """Remove an alert configuration by index"""
         if 0 <= index < len(self.alert_configs):
+            sensor_id = self.alert_configs[index]['sensor_id']
             del self.alert_configs[index]
+            # Rebuild the bucket for the affected sensor
+            bucket = [c for c in self.alert_configs if c['sensor_id'] == sensor_id]
+            if bucket:
+                self._by_sensor[sensor_id] = bucket
+            else:
+                self._by_sensor.pop(sensor_id, None)
             return True
         return False
     
@@ -40,27 +92,17 @@ class AlertSystem:
             return []
         
         triggered_alerts = []
-        
-        # Find alert configs for this sensor
-        for config in self.alert_configs:
-            if config['sensor_id'] == sensor['id']:
-                alert_type = config['type']
-                threshold = config['threshold']
-                
-                # Check different alert types
-                if alert_type == 'Threshold High' and data['value'] > threshold:
-                    triggered_alerts.append(
-                        f"{sensor['name']} value {data['value']} exceeds threshold {threshold}"
-                    )
-                elif alert_type == 'Threshold Low' and data['value'] < threshold:
-                    triggered_alerts.append(
-                        f"{sensor['name']} value {data['value']} is below threshold {threshold}"
-                    )
-                elif alert_type == 'Change Rate':
-                    # For change rate alerts, we need previous data
-                    # This is a simplified implementation
-                    pass
-        
+
+        # Hoist the repeated dict lookups out of the loop; only the configs
+        # registered for this sensor are inspected, each carrying its
+        # pre-resolved check function
+        name = sensor['name']
+        value = data['value']
+        for config in self._by_sensor.get(sensor['id'], ()):
+            message = config['_check'](name, value, config['threshold'])
+            if message:
+                triggered_alerts.append(message)
+
         return triggered_alerts
     
     def _get_prev_value(self, sensor_id, db_manager):
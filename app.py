@@ -1,16 +1,14 @@
 import streamlit as st
-import pandas as pd
-import time
-import yaml
-import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
-from iot_platforms import IoTPlatformFactory
 from data_handlers import DataHandler
-from visualization import create_line_chart, create_gauge_chart, create_bar_chart, create_stats_summary
 from alert_system import AlertSystem
 from db_manager import DatabaseManager
-from utils import load_config, get_demo_data
+from utils import load_config, get_demo_data, get_env
+
+# pandas, plotly (via visualization) and the platform integrations are
+# imported lazily where they are first needed to keep cold boot fast
 
 # Page configuration
 st.set_page_config(
@@ -20,8 +18,25 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Load configuration
-config = load_config()
+# Load configuration once per process; reruns reuse the parsed result
+# instead of re-reading and re-parsing the YAML file
+@st.cache_resource
+def _cfg():
+    return load_config()
+
+config = _cfg()
+
+# Cached helper for the historical tab: reruns with unchanged inputs reuse
+# the previous DataFrame instead of rebuilding it on every refresh
+@st.cache_data(ttl=60, max_entries=64)
+def _hist_frame(sensor_id, timestamps, values, unit):
+    import pandas as pd
+    return pd.DataFrame({
+        'sensor_id': sensor_id,
+        'timestamp': timestamps,
+        'value': values,
+        'unit': unit
+    })
 
 # Initialize session state variables if they don't exist
 if 'connected' not in st.session_state:
@@ -32,8 +47,13 @@ if 'sensors' not in st.session_state:
     st.session_state.sensors = []
 if 'selected_sensors' not in st.session_state:
     st.session_state.selected_sensors = []
+if 'sensors_by_name' not in st.session_state:
+    st.session_state.sensors_by_name = {}
 if 'alerts' not in st.session_state:
     st.session_state.alerts = []
+if 'alert_msgs' not in st.session_state:
+    # Companion set of alert messages for O(1) duplicate checks
+    st.session_state.alert_msgs = set()
 if 'db_manager' not in st.session_state:
     st.session_state.db_manager = DatabaseManager()
 if 'data_handler' not in st.session_state:
@@ -55,7 +75,7 @@ if selected_platform:
     for param, param_info in config['platforms'][selected_platform]['connection_params'].items():
         # Get the param from environment variables or use the default
         env_var_name = param_info.get('env_var', '')
-        default_value = os.getenv(env_var_name, param_info.get('default', ''))
+        default_value = get_env(env_var_name, param_info.get('default', ''))
         
         if param_info.get('sensitive', False):
             connection_params[param] = st.sidebar.text_input(
@@ -73,7 +93,9 @@ if selected_platform:
     if st.sidebar.button("Connect"):
         with st.spinner(f"Connecting to {selected_platform}..."):
             try:
-                # Create platform instance
+                # Create platform instance (the platform integrations only
+                # load once the user actually connects)
+                from iot_platforms import IoTPlatformFactory
                 platform_factory = IoTPlatformFactory()
                 platform = platform_factory.create_platform(selected_platform, connection_params)
                 
@@ -121,11 +143,19 @@ if st.session_state.connected:
                     selected_sensors.append(sensor)
         
         st.session_state.selected_sensors = selected_sensors
+        # Name-keyed index so the tabs can look sensors up directly
+        st.session_state.sensors_by_name = {
+            s['name']: s for s in selected_sensors
+        }
     else:
         st.info("No sensors detected. Please check your connection or device configuration.")
     
     # Data visualization section
     if st.session_state.selected_sensors:
+        # Charting (and with it plotly) is only loaded once there is
+        # something to visualize
+        from visualization import create_line_chart, create_gauge_chart, create_stats_summary
+
         st.subheader("Sensor Data Visualization")
         
         # Time range selection
@@ -144,19 +174,35 @@ if st.session_state.connected:
         
         with tab1:
             st.write("Real-time sensor readings (refreshes automatically)")
-            
-            # Create a placeholder for real-time data
-            real_time_container = st.empty()
-            
-            # Auto-refresh every 5 seconds (this is for demonstration - in production you might use MQTT websockets)
-            with real_time_container.container():
+
+            # Only this fragment re-runs on each refresh; the sidebar, config
+            # loading and the other tabs stay out of the refresh path
+            @st.fragment(run_every=config['app']['refresh_interval'])
+            def _real_time_readings():
+                from iot_platforms import format_timestamps
+
+                platform = st.session_state.platform
+
+                # Dispatch all fetches concurrently so the refresh waits for
+                # the slowest sensor instead of the sum of all of them
+                futures = {}
+                if platform:
+                    if 'io_pool' not in st.session_state:
+                        st.session_state.io_pool = ThreadPoolExecutor(max_workers=8)
+                    futures = {
+                        sensor['id']: st.session_state.io_pool.submit(
+                            platform.get_latest_data, sensor['id']
+                        )
+                        for sensor in st.session_state.selected_sensors
+                    }
+
                 for sensor in st.session_state.selected_sensors:
                     st.write(f"### {sensor['name']} ({sensor['type']})")
-                    
+
                     # Get latest data for the sensor
                     try:
-                        if st.session_state.platform:
-                            latest_data = st.session_state.platform.get_latest_data(sensor['id'])
+                        if platform:
+                            latest_data = futures[sensor['id']].result()
                             st.session_state.data_handler.save_sensor_data(sensor['id'], latest_data)
                             
                             # Check alerts for this sensor data
@@ -165,7 +211,8 @@ if st.session_state.connected:
                                 for alert in alerts:
                                     st.warning(f"⚠️ ALERT: {alert}")
                                     # Add to alerts list if not already there
-                                    if alert not in [a['message'] for a in st.session_state.alerts]:
+                                    if alert not in st.session_state.alert_msgs:
+                                        st.session_state.alert_msgs.add(alert)
                                         st.session_state.alerts.append({
                                             'sensor': sensor['name'],
                                             'message': alert,
@@ -180,16 +227,15 @@ if st.session_state.connected:
                             else:
                                 st.write(f"Current value: {latest_data['value']} {latest_data.get('unit', '')}")
                             
-                            # Show last updated time
-                            st.caption(f"Last updated: {latest_data['timestamp']}")
+                            # Show last updated time (readings carry epoch
+                            # seconds; format only here at the display edge)
+                            st.caption(f"Last updated: {format_timestamps(latest_data['timestamp'])}")
                         else:
                             st.warning("Platform connection lost. Please reconnect.")
                     except Exception as e:
                         st.error(f"Error fetching data: {str(e)}")
-                
-                # Auto-refresh (this will be better implemented with WebSockets in production)
-                time.sleep(5)
-                st.rerun()
+
+            _real_time_readings()
         
         with tab2:
             st.write("Historical data analysis")
@@ -206,9 +252,8 @@ if st.session_state.connected:
             )
             
             # Find the selected sensor object
-            selected_sensor_obj = next(
-                (s for s in st.session_state.selected_sensors if s['name'] == selected_sensor_for_history), 
-                None
+            selected_sensor_obj = st.session_state.sensors_by_name.get(
+                selected_sensor_for_history
             )
             
             if selected_sensor_obj:
@@ -220,9 +265,17 @@ if st.session_state.connected:
                         end_time
                     )
                     
-                    if historical_data:
-                        # Convert to DataFrame
-                        df = pd.DataFrame(historical_data)
+                    if historical_data and len(historical_data['values']):
+                        # The platform returns one columnar payload with
+                        # fixed-point values; decode and build the
+                        # DataFrame from its arrays via the cache
+                        from iot_platforms import decode_values
+                        df = _hist_frame(
+                            historical_data['sensor_id'],
+                            historical_data['timestamps'],
+                            decode_values(historical_data),
+                            historical_data['unit']
+                        )
                         
                         # Display statistics
                         stats_cols = st.columns(4)
@@ -256,9 +309,8 @@ if st.session_state.connected:
             )
             
             # Find the selected sensor object
-            selected_sensor_obj = next(
-                (s for s in st.session_state.selected_sensors if s['name'] == selected_sensor_for_alert), 
-                None
+            selected_sensor_obj = st.session_state.sensors_by_name.get(
+                selected_sensor_for_alert
             )
             
             if selected_sensor_obj:
@@ -312,6 +364,7 @@ if st.session_state.connected:
             # Display alert history
             st.subheader("Alert History")
             if st.session_state.alerts:
+                import pandas as pd
                 alert_df = pd.DataFrame(st.session_state.alerts)
                 st.dataframe(alert_df)
             else:
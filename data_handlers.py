@@ -1,8 +1,54 @@
 import pandas as pd
+import numpy as np
 from datetime import datetime
 import json
 import os
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pa_parquet
+except ImportError:
+    pa = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _anomaly_mask(values, threshold):
+        """Return a boolean mask of values more than threshold sample
+        standard deviations away from the mean"""
+        n = values.shape[0]
+        mean = values.mean()
+        acc = 0.0
+        for i in range(n):
+            d = values[i] - mean
+            acc += d * d
+        std_dev = (acc / (n - 1)) ** 0.5
+        limit = threshold * std_dev
+        out = np.empty(n, np.bool_)
+        for i in range(n):
+            out[i] = abs(values[i] - mean) > limit
+        return out
+
+    # Warm the JIT at import time so the first dashboard request
+    # does not pay the compilation cost
+    _anomaly_mask(np.zeros(8, dtype=np.float64), 2.0)
+else:
+    def _anomaly_mask(values, threshold):
+        """Return a boolean mask of values more than threshold sample
+        standard deviations away from the mean"""
+        return np.abs(values - values.mean()) > threshold * values.std(ddof=1)
+
+
 class DataHandler:
     """Class to handle data processing and storage"""
     
@@ -45,21 +91,33 @@ class DataHandler:
                 'std_dev': None
             }
         
-        # Convert to DataFrame for easier analysis
+        # Extract values as a contiguous float64 array; for a list of dicts
+        # this skips DataFrame construction entirely
         if isinstance(data, list):
-            df = pd.DataFrame(data)
+            values = np.fromiter(
+                (d['value'] for d in data), dtype=np.float64, count=len(data)
+            )
         else:
-            df = data
-        
-        # Calculate statistics
+            values = data['value'].to_numpy(dtype=np.float64)
+
+        # Single median selection without a full sort; even-length arrays
+        # average the two middle elements
+        mid = len(values) // 2
+        if len(values) % 2:
+            median = np.partition(values, mid)[mid]
+        else:
+            part = np.partition(values, [mid - 1, mid])
+            median = (part[mid - 1] + part[mid]) / 2.0
+
+        # Calculate statistics with NumPy reductions over the one array
         stats = {
-            'min': df['value'].min(),
-            'max': df['value'].max(),
-            'avg': df['value'].mean(),
-            'median': df['value'].median(),
-            'std_dev': df['value'].std()
+            'min': values.min(),
+            'max': values.max(),
+            'avg': values.mean(),
+            'median': median,
+            'std_dev': values.std(ddof=1) if len(values) > 1 else np.nan
         }
-        
+
         return stats
     
     def detect_anomalies(self, data, threshold=2.0):
@@ -72,15 +130,13 @@ class DataHandler:
             df = pd.DataFrame(data)
         else:
             df = data
-        
-        # Calculate mean and standard deviation
-        mean = df['value'].mean()
-        std_dev = df['value'].std()
-        
-        # Find anomalies (values that are more than threshold standard deviations from the mean)
-        anomalies = df[abs(df['value'] - mean) > threshold * std_dev]
-        
-        return anomalies.to_dict('records')
+
+        # Run the numeric work on a contiguous array; pandas is only used
+        # to materialize the matching records
+        values = np.ascontiguousarray(df['value'].to_numpy(np.float64))
+        mask = _anomaly_mask(values, threshold)
+
+        return df[mask].to_dict('records')
     
     def export_data(self, data, format='csv', filename=None):
         """Export sensor data to a file"""
@@ -98,11 +154,32 @@ class DataHandler:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"sensor_data_{timestamp}.{format}"
         
-        # Export based on format
+        # Export based on format; CSV and Parquet go through PyArrow's C++
+        # writers when available
         if format.lower() == 'csv':
-            df.to_csv(filename, index=False)
+            if pa is not None:
+                pa_csv.write_csv(
+                    pa.Table.from_pandas(df, preserve_index=False), filename
+                )
+            else:
+                df.to_csv(filename, index=False)
+        elif format.lower() == 'parquet':
+            if pa is None:
+                raise ValueError("Parquet export requires pyarrow")
+            pa_parquet.write_table(
+                pa.Table.from_pandas(df, preserve_index=False),
+                filename,
+                compression='zstd'
+            )
         elif format.lower() == 'json':
-            df.to_json(filename, orient='records')
+            if orjson is not None:
+                with open(filename, 'wb') as f:
+                    f.write(orjson.dumps(
+                        df.to_dict('records'),
+                        option=orjson.OPT_SERIALIZE_NUMPY
+                    ))
+            else:
+                df.to_json(filename, orient='records')
         elif format.lower() == 'excel':
             df.to_excel(filename, index=False)
         else:
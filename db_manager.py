@@ -1,133 +1,322 @@
 import pandas as pd
+import numpy as np
 from datetime import datetime
 import sqlite3
 import os
 import json
 
+_TS_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Initial number of slots reserved per sensor; buffers double when full
+_INITIAL_CAPACITY = 256
+
+# Upper bound on slots per sensor: 24 hours of readings at the 5-second
+# refresh interval. Beyond this the buffer becomes a ring and each insert
+# overwrites the oldest slot, keeping memory per sensor constant.
+_MAX_CAPACITY = 17_280
+
+def _to_epoch_us(value):
+    """Convert a timestamp to epoch microseconds.
+
+    Plain numbers are taken as epoch seconds (the compact form readings
+    carry). Strings in the standard dashboard format take the fast
+    strptime path; anything else (other string formats, pandas/NumPy
+    timestamps) is normalized through pd.Timestamp. Naive timestamps are
+    local wall clock, matching how readings are rendered for display.
+    """
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        # Readings carry epoch seconds as plain numbers
+        return int(value * 1_000_000)
+    if isinstance(value, str):
+        try:
+            value = datetime.strptime(value, _TS_FORMAT)
+        except ValueError:
+            value = pd.Timestamp(value).to_pydatetime()
+    elif not isinstance(value, datetime):
+        value = pd.Timestamp(value).to_pydatetime()
+    return int(value.timestamp() * 1_000_000)
+
+class _SensorBuffer:
+    """Columnar (structure-of-arrays) storage for one sensor's readings.
+
+    Timestamps are kept as int64 epoch microseconds and values as float64
+    in pre-allocated NumPy arrays with geometric growth; any extra fields
+    (e.g. unit) live in a parallel list. Row dicts are only rebuilt when a
+    caller asks for records.
+
+    Appends are normally chronological, so the timestamp column stays
+    sorted and range queries can binary-search it. An out-of-order append
+    clears the invariant and the buffer is re-sorted lazily on the next
+    query.
+
+    Capacity doubles up to _MAX_CAPACITY; once full the buffer is a ring
+    and each append overwrites the oldest slot, so a long-running
+    dashboard uses constant memory per sensor. Readers restore insertion
+    order lazily via ensure_sorted.
+    """
+    __slots__ = ('ts', 'val', 'extra', 'n', 'head', 'sorted')
+
+    def __init__(self, capacity=_INITIAL_CAPACITY):
+        self.ts = np.empty(capacity, dtype=np.int64)
+        self.val = np.empty(capacity, dtype=np.float64)
+        self.extra = []
+        self.n = 0
+        self.head = 0
+        self.sorted = True
+
+    def append(self, ts_us, value, extra):
+        """Append one reading, doubling capacity up to the ring bound"""
+        cap = len(self.ts)
+        if self.n == cap:
+            if cap < _MAX_CAPACITY:
+                self._grow(min(2 * cap, _MAX_CAPACITY))
+            else:
+                # At the ring bound: overwrite the oldest slot in place
+                slot = self.head
+                self.head = (self.head + 1) % cap
+                if ts_us < self.ts[slot - 1 if slot else cap - 1]:
+                    self.sorted = False
+                self.ts[slot] = ts_us
+                self.val[slot] = value
+                self.extra[slot] = extra
+                return
+        if self.n and ts_us < self.ts[self.n - 1]:
+            self.sorted = False
+        self.ts[self.n] = ts_us
+        self.val[self.n] = value
+        self.extra.append(extra)
+        self.n += 1
+
+    def extend(self, ts_us, values, extras):
+        """Bulk-append whole columns of readings in one shot"""
+        m = len(ts_us)
+        if m > _MAX_CAPACITY:
+            # Only the newest rows can survive the ring bound anyway
+            ts_us = ts_us[-_MAX_CAPACITY:]
+            values = values[-_MAX_CAPACITY:]
+            extras = extras[-_MAX_CAPACITY:]
+            m = _MAX_CAPACITY
+        self.ensure_sorted()
+        needed = self.n + m
+        if needed > _MAX_CAPACITY:
+            # Evict the oldest rows so the ring bound holds after the append
+            drop = needed - _MAX_CAPACITY
+            self.ts[:self.n - drop] = self.ts[drop:self.n]
+            self.val[:self.n - drop] = self.val[drop:self.n]
+            self.extra = self.extra[drop:]
+            self.n -= drop
+            needed = self.n + m
+        if needed > len(self.ts):
+            self._grow(min(_MAX_CAPACITY, max(2 * len(self.ts), needed)))
+        if m:
+            if self.n and ts_us[0] < self.ts[self.n - 1]:
+                self.sorted = False
+            if m > 1 and np.any(np.diff(ts_us) < 0):
+                self.sorted = False
+        self.ts[self.n:needed] = ts_us
+        self.val[self.n:needed] = values
+        self.extra.extend(extras)
+        self.n = needed
+
+    def ensure_sorted(self):
+        """Restore insertion order after a ring wrap and re-sort
+        chronologically if an out-of-order append occurred"""
+        if self.head:
+            self.ts[:] = np.roll(self.ts, -self.head)
+            self.val[:] = np.roll(self.val, -self.head)
+            self.extra = self.extra[self.head:] + self.extra[:self.head]
+            self.head = 0
+        if self.sorted:
+            return
+        order = np.argsort(self.ts[:self.n], kind='stable')
+        self.ts[:self.n] = self.ts[:self.n][order]
+        self.val[:self.n] = self.val[:self.n][order]
+        self.extra = [self.extra[i] for i in order]
+        self.sorted = True
+
+    def _grow(self, capacity):
+        ts = np.empty(capacity, dtype=np.int64)
+        ts[:self.n] = self.ts[:self.n]
+        self.ts = ts
+        val = np.empty(capacity, dtype=np.float64)
+        val[:self.n] = self.val[:self.n]
+        self.val = val
+
 class DatabaseManager:
     """Manage sensor data storage and retrieval"""
-    
+
     def __init__(self, db_path=None):
         """Initialize the database manager"""
         # For simplicity, we'll use an in-memory database
         # In a production environment, you'd want to use a proper database
-        self.data = {}  # Dictionary to store sensor data by sensor_id
-    
+        self._buf = {}  # Columnar buffer per sensor_id
+
     def insert_sensor_data(self, data):
         """Insert sensor data into the database"""
         if not isinstance(data, dict):
             raise ValueError("Data must be a dictionary")
-        
+
         required_fields = ['sensor_id', 'timestamp', 'value']
         for field in required_fields:
             if field not in data:
                 raise ValueError(f"Data missing required field: {field}")
-        
+
         sensor_id = data['sensor_id']
-        
-        # Create entry for this sensor if it doesn't exist
-        if sensor_id not in self.data:
-            self.data[sensor_id] = []
-        
-        # Add the data point
-        self.data[sensor_id].append(data.copy())
-        
+
+        # Create a buffer for this sensor if it doesn't exist
+        if sensor_id not in self._buf:
+            self._buf[sensor_id] = _SensorBuffer()
+
+        # Store the reading columnar; extra fields (unit, ...) are kept aside
+        buf = self._buf[sensor_id]
+        extra = {
+            k: v for k, v in data.items()
+            if k not in ('sensor_id', 'timestamp', 'value')
+        }
+        # Share the previous extra dict when the non-core fields are
+        # unchanged (the common case: a constant unit per sensor), so the
+        # hot write path allocates nothing per row beyond the array slots
+        if buf.extra and buf.extra[-1] == extra:
+            extra = buf.extra[-1]
+        buf.append(_to_epoch_us(data['timestamp']), data['value'], extra)
+
         return True
-    
+
+    def _record(self, sensor_id, buf, i):
+        """Materialize one stored reading back into a dict.
+
+        The returned dict is freshly built and owned by the caller; no
+        defensive copies are made anywhere else on the query path.
+        """
+        item = {
+            'sensor_id': sensor_id,
+            'timestamp': datetime.fromtimestamp(
+                buf.ts[i] / 1_000_000
+            ).strftime(_TS_FORMAT),
+            'value': buf.val[i].item(),
+        }
+        item.update(buf.extra[i])
+        return item
+
     def query_sensor_data(self, sensor_id, start_time, end_time):
         """Query sensor data for a specific time range"""
-        if sensor_id not in self.data:
+        if sensor_id not in self._buf:
             return []
-        
-        # Filter data by time range
-        result = []
-        for item in self.data[sensor_id]:
-            item_time = item['timestamp']
-            if isinstance(item_time, str):
-                item_time = datetime.strptime(item_time, "%Y-%m-%d %H:%M:%S")
-            
-            if start_time <= item_time <= end_time:
-                result.append(item.copy())
-        
-        return result
-    
+
+        buf = self._buf[sensor_id]
+        buf.ensure_sorted()
+
+        # Translate the bounds once, then binary-search the sorted
+        # timestamp column instead of scanning it
+        ts = buf.ts[:buf.n]
+        lo = np.searchsorted(ts, _to_epoch_us(start_time), side='left')
+        hi = np.searchsorted(ts, _to_epoch_us(end_time), side='right')
+
+        return [self._record(sensor_id, buf, i) for i in range(lo, hi)]
+
     def query_latest_sensor_data(self, sensor_id):
         """Query the latest data point for a sensor"""
-        if sensor_id not in self.data or not self.data[sensor_id]:
+        if sensor_id not in self._buf or not self._buf[sensor_id].n:
             return None
-        
-        # Get the latest item (assuming data is appended chronologically)
-        latest = self.data[sensor_id][-1].copy()
-        
-        return latest
-    
+
+        # Get the latest item (chronologically last after sorting)
+        buf = self._buf[sensor_id]
+        buf.ensure_sorted()
+        return self._record(sensor_id, buf, buf.n - 1)
+
     def delete_sensor_data(self, sensor_id=None, older_than=None):
         """Delete sensor data, optionally filtering by sensor_id and age"""
-        if sensor_id and sensor_id in self.data:
+        if sensor_id and sensor_id in self._buf:
             if older_than:
                 # Delete only data older than the specified date
-                cutoff_time = older_than
-                if isinstance(cutoff_time, str):
-                    cutoff_time = datetime.strptime(cutoff_time, "%Y-%m-%d %H:%M:%S")
-                
-                self.data[sensor_id] = [
-                    item for item in self.data[sensor_id]
-                    if datetime.strptime(item['timestamp'], "%Y-%m-%d %H:%M:%S") >= cutoff_time
-                ]
+                self._drop_older(sensor_id, _to_epoch_us(older_than))
             else:
                 # Delete all data for this sensor
-                self.data[sensor_id] = []
+                self._buf[sensor_id] = _SensorBuffer()
             return True
         elif sensor_id is None and older_than:
             # Delete data older than the specified date for all sensors
-            cutoff_time = older_than
-            if isinstance(cutoff_time, str):
-                cutoff_time = datetime.strptime(cutoff_time, "%Y-%m-%d %H:%M:%S")
-            
-            for sid in self.data:
-                self.data[sid] = [
-                    item for item in self.data[sid]
-                    if datetime.strptime(item['timestamp'], "%Y-%m-%d %H:%M:%S") >= cutoff_time
-                ]
+            cutoff_us = _to_epoch_us(older_than)
+            for sid in self._buf:
+                self._drop_older(sid, cutoff_us)
             return True
         elif sensor_id is None:
             # Clear all data
-            self.data = {}
+            self._buf = {}
             return True
-        
+
         return False
-    
+
+    def _drop_older(self, sensor_id, cutoff_us):
+        """Drop all readings for a sensor older than the cutoff time"""
+        buf = self._buf[sensor_id]
+        buf.ensure_sorted()
+        keep = buf.ts[:buf.n] >= cutoff_us
+        kept = int(keep.sum())
+        buf.ts[:kept] = buf.ts[:buf.n][keep]
+        buf.val[:kept] = buf.val[:buf.n][keep]
+        buf.extra = [e for e, k in zip(buf.extra, keep) if k]
+        buf.n = kept
+
     def get_sensors_with_data(self):
         """Get a list of sensor IDs that have data"""
-        return list(self.data.keys())
-    
+        return list(self._buf.keys())
+
     def export_to_csv(self, sensor_id, filepath):
         """Export sensor data to a CSV file"""
-        if sensor_id not in self.data or not self.data[sensor_id]:
+        if sensor_id not in self._buf or not self._buf[sensor_id].n:
             return False
-        
+
         # Convert to DataFrame
-        df = pd.DataFrame(self.data[sensor_id])
-        
+        buf = self._buf[sensor_id]
+        buf.ensure_sorted()
+        df = pd.DataFrame(
+            self._record(sensor_id, buf, i) for i in range(buf.n)
+        )
+
         # Export to CSV
         df.to_csv(filepath, index=False)
-        
+
         return True
-    
+
+    def _bulk_insert(self, sensor_id, ts_us, values, extras):
+        """Append whole columns of readings for one sensor at once"""
+        if sensor_id not in self._buf:
+            self._buf[sensor_id] = _SensorBuffer()
+        self._buf[sensor_id].extend(ts_us, values, extras)
+
     def import_from_csv(self, sensor_id, filepath):
         """Import sensor data from a CSV file"""
         if not os.path.exists(filepath):
             return False
-        
-        # Read CSV file
-        df = pd.read_csv(filepath)
-        
-        # Convert to list of dictionaries
-        data_list = df.to_dict('records')
-        
-        # Add each data point
-        for data in data_list:
-            data['sensor_id'] = sensor_id
-            self.insert_sensor_data(data)
-        
+
+        # Read CSV file with timestamps parsed in one vectorized pass
+        df = pd.read_csv(filepath, parse_dates=['timestamp'])
+
+        for field in ('timestamp', 'value'):
+            if field not in df.columns:
+                raise ValueError(f"Data missing required field: {field}")
+
+        # Convert the whole file to columns and append in one shot instead
+        # of validating and inserting row by row. The resolution read_csv
+        # parses to differs across pandas versions, so pin it to
+        # microseconds before taking the integer view.
+        ts = df['timestamp']
+        if ts.dt.tz is None:
+            # Naive timestamps are local wall clock, matching _to_epoch_us
+            ts = ts.dt.tz_localize(datetime.now().astimezone().tzinfo)
+        ts_us = ts.astype('datetime64[us, UTC]').astype('int64').to_numpy()
+        values = df['value'].to_numpy(np.float64)
+
+        extra_cols = [
+            c for c in df.columns
+            if c not in ('sensor_id', 'timestamp', 'value')
+        ]
+        if extra_cols:
+            extras = df[extra_cols].to_dict('records')
+        else:
+            extras = [{}] * len(df)
+
+        self._bulk_insert(sensor_id, ts_us, values, extras)
+
         return True
@@ -1,10 +1,320 @@
 import os
+import sys
 import requests
+from requests.adapters import HTTPAdapter, Retry
 import json
 import time
+import selectors
+import threading
+import weakref
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import numpy as np
 import paho.mqtt.client as mqtt
-from datetime import datetime, timedelta
-import random
+from datetime import datetime
+from types import MappingProxyType
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Sensor-id substring -> canonical sensor type; resolved once per call so
+# the generation branches compare pre-computed types instead of re-running
+# substring searches
+_SENSOR_TYPE_TABLE = {
+    'temp': 'temperature',
+    'humid': 'humidity',
+    'motion': 'motion',
+    'pressure': 'pressure',
+    'light': 'light',
+    'co2': 'co2',
+    'occupancy': 'occupancy',
+}
+
+def _pooled_session():
+    """Build a requests.Session with pooled, retrying HTTP adapters.
+
+    API calls made through the session reuse its keep-alive connections,
+    so the TCP+TLS handshake is paid once per host instead of once per
+    request; transient failures retry with a short backoff.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=64,
+        max_retries=Retry(total=3, backoff_factor=0.2),
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+def _sensor_type(sensor_id):
+    """Resolve the sensor type encoded in a sensor id, or None"""
+    for key, stype in _SENSOR_TYPE_TABLE.items():
+        if key in sensor_id:
+            return stype
+    return None
+
+def _fmt_ts(dt):
+    """Format a datetime in the dashboard timestamp format.
+
+    Equivalent to strftime("%Y-%m-%d %H:%M:%S") but skips the format
+    string parsing, which makes it ~3x faster for this fixed layout.
+    """
+    return (
+        f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} "
+        f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}"
+    )
+
+def format_timestamps(timestamps):
+    """Format compact timestamps for display at the presentation boundary.
+
+    Readings carry epoch-second ints and payloads carry datetime64 arrays;
+    this is the one place either is turned into the dashboard's
+    "YYYY-MM-DD HH:MM:SS" strings. Arrays come back as a list of strings,
+    a scalar comes back as one string.
+    """
+    if isinstance(timestamps, np.ndarray):
+        return [
+            s.replace('T', ' ')
+            for s in np.datetime_as_string(timestamps, unit='s')
+        ]
+    return _fmt_ts(datetime.fromtimestamp(int(timestamps)))
+
+def _random_timeline(rng, start_time, end_time, gap_min, gap_max):
+    """Generate irregular sample timestamps between start and end.
+
+    Returns a datetime64[s] array starting at start_time with random gaps
+    of gap_min..gap_max minutes, drawn from rng in one bulk pass instead
+    of a per-sample Python loop.
+    """
+    total_seconds = (end_time - start_time).total_seconds()
+    if total_seconds < 0:
+        return np.empty(0, dtype='datetime64[s]')
+
+    # Draw more gaps than can possibly fit, then truncate
+    upper = int(total_seconds // (60 * gap_min)) + 2
+    gaps = rng.integers(gap_min, gap_max + 1, size=upper)
+    offsets = np.concatenate(([0], np.cumsum(gaps)))
+    offsets = offsets[offsets * 60 <= total_seconds]
+
+    start = np.datetime64(start_time.replace(microsecond=0), 's')
+    return start + offsets.astype('timedelta64[m]')
+
+# Shared unit strings: every reading and payload references these single
+# objects instead of a fresh per-call literal, so equality checks hit the
+# identity fast path and repeated catalogs don't duplicate the strings
+# ('°C' is non-ASCII and multi-char literals aren't auto-interned)
+_UNIT_C = sys.intern('°C')
+_UNIT_PCT = sys.intern('%')
+_UNIT_HPA = sys.intern('hPa')
+_UNIT_LUX = sys.intern('lux')
+_UNIT_PPM = sys.intern('ppm')
+_UNIT_BINARY = sys.intern('binary')
+_UNIT_PEOPLE = sys.intern('people')
+_UNIT_COUNT = sys.intern('count')
+
+# Fixed-point storage spec per unit: (dtype, scale, offset). A value is
+# stored as (real - offset) * scale in the smallest dtype that covers the
+# sensor type's range; decode_values restores the real numbers.
+_QUANT_SPECS = {
+    _UNIT_C: (np.int16, 10, 0),
+    _UNIT_PCT: (np.int16, 10, 0),
+    _UNIT_HPA: (np.int16, 10, 900),
+    _UNIT_LUX: (np.uint16, 1, 0),
+    _UNIT_PPM: (np.uint16, 1, 0),
+    _UNIT_BINARY: (np.uint8, 1, 0),
+    _UNIT_PEOPLE: (np.uint8, 1, 0),
+    _UNIT_COUNT: (np.uint8, 1, 0),
+}
+
+def _columns(sensor_id, timestamps, values, unit):
+    """Build the columnar payload returned by get_historical_data,
+    quantizing values to their fixed-point storage dtype"""
+    spec = _QUANT_SPECS.get(unit)
+    if spec is not None:
+        dtype, scale, offset = spec
+        values = np.round(
+            (np.asarray(values, dtype=np.float64) - offset) * scale
+        ).astype(dtype)
+    else:
+        scale, offset = 1, 0
+        values = np.asarray(values)
+    return {
+        'sensor_id': sensor_id,
+        'unit': unit,
+        'timestamps': timestamps,
+        'values': values,
+        'scale': scale,
+        'offset': offset
+    }
+
+def decode_values(payload):
+    """Decode a payload's fixed-point values back to real numbers"""
+    values = payload['values']
+    scale = payload.get('scale', 1)
+    offset = payload.get('offset', 0)
+    if scale == 1 and offset == 0:
+        return values
+    return np.round(values.astype(np.float64) / scale + offset, 1)
+
+def iter_rows(payload):
+    """Yield row dicts from a columnar payload, for callers that still
+    want the legacy list-of-dicts shape"""
+    sensor_id = payload['sensor_id']
+    unit = payload['unit']
+    strings = np.datetime_as_string(payload['timestamps'], unit='s')
+    for t, v in zip(strings, decode_values(payload)):
+        yield {
+            'sensor_id': sensor_id,
+            'timestamp': t.replace('T', ' '),
+            'value': v.item(),
+            'unit': unit
+        }
+
+def _hours_of_day(timestamps):
+    """Hour-of-day (0-23) for each timestamp in a datetime64 array"""
+    return timestamps.astype('datetime64[h]').astype(np.int64) % 24
+
+def _weekdays(timestamps):
+    """Weekday (Monday=0) for each timestamp in a datetime64 array"""
+    days = timestamps.astype('datetime64[D]').astype(np.int64)
+    # The NumPy epoch (1970-01-01) was a Thursday
+    return (days + 3) % 7
+
+# Precomputed 24-entry tables for the simulated diurnal patterns, indexed
+# by hour of day; a branchless table lookup replaces the piecewise
+# expressions that np.where had to evaluate on both sides
+_HOURS = np.arange(24)
+_TEMP_BASE_LUT = np.array(
+    [20.0 + (h - 12) * 0.5 if h > 12 else 20.0 - (12 - h) * 0.2
+     for h in range(24)]
+)
+_DAYLIGHT = (_HOURS >= 6) & (_HOURS <= 18)
+_LIGHT_LO_LUT = np.where(_DAYLIGHT, 300.0, 0.0)
+_LIGHT_HI_LUT = np.where(_DAYLIGHT, 1000.0, 50.0)
+_WORK_HOURS = (_HOURS >= 8) & (_HOURS <= 18)
+_CO2_LO_LUT = np.where(_WORK_HOURS, 600.0, 400.0)
+_CO2_HI_LUT = np.where(_WORK_HOURS, 1200.0, 600.0)
+
+# Occupancy depends on the weekday as well, so its draw bounds form a
+# (7, 24) grid: weekday work hours run busy, everything else runs quiet
+_OCC_LO_LUT = np.zeros((7, 24), dtype=np.int64)
+_OCC_LO_LUT[:5, _WORK_HOURS] = 1
+_OCC_HI_LUT = np.full((7, 24), 3, dtype=np.int64)
+_OCC_HI_LUT[:5, _WORK_HOURS] = 11
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _banded_draws(lo_lut, hi_lut, hours, u):
+        """Scale unit draws into each sample's [lo, hi) hour band and
+        round to whole numbers, fused into one compiled pass"""
+        out = np.empty(u.shape[0])
+        for i in range(u.shape[0]):
+            h = hours[i]
+            lo = lo_lut[h]
+            out[i] = round(lo + u[i] * (hi_lut[h] - lo))
+        return out
+
+    # Warm the JIT at import time so the first refresh doesn't pay the
+    # compile; the cached binary makes later imports cheap
+    _banded_draws(
+        np.zeros(24), np.ones(24),
+        np.zeros(8, dtype=np.int64), np.zeros(8)
+    )
+else:
+    def _banded_draws(lo_lut, hi_lut, hours, u):
+        """NumPy fallback when numba isn't installed"""
+        lo = np.take(lo_lut, hours)
+        return np.round(lo + u * (np.take(hi_lut, hours) - lo), 0)
+
+@lru_cache(maxsize=None)
+def _reading_template(sensor_id, unit):
+    """Cached 4-key reading dict per sensor; see _reading"""
+    return {
+        'sensor_id': sensor_id,
+        'timestamp': None,
+        'value': None,
+        'unit': unit
+    }
+
+def _reading(sensor_id, timestamp, value, unit):
+    """Build a latest-reading dict by copying the sensor's cached template
+    and patching the two per-call slots, which skips re-inserting the
+    constant sensor_id/unit keys on every refresh"""
+    item = _reading_template(sensor_id, unit).copy()
+    item['timestamp'] = timestamp
+    item['value'] = value
+    return item
+
+def _gen_temperature(rng, timestamps, n):
+    """Flat indoor temperature band"""
+    return np.round(rng.uniform(18.0, 26.0, n), 1)
+
+def _gen_temperature_diurnal(rng, timestamps, n):
+    """Temperature pattern through the day around the hourly base curve"""
+    base = np.take(_TEMP_BASE_LUT, _hours_of_day(timestamps))
+    return np.round(base + rng.uniform(-1.0, 1.0, n), 1)
+
+def _gen_humidity(rng, timestamps, n):
+    return np.round(rng.uniform(30.0, 70.0, n), 1)
+
+def _gen_motion(rng, timestamps, n):
+    return rng.integers(0, 2, n)
+
+def _gen_pressure(rng, timestamps, n):
+    return np.round(rng.uniform(980.0, 1020.0, n), 1)
+
+def _gen_light(rng, timestamps, n):
+    """Day/night cycle drawn between each hour's brightness bounds"""
+    hours = _hours_of_day(timestamps)
+    return _banded_draws(
+        _LIGHT_LO_LUT, _LIGHT_HI_LUT, hours, rng.uniform(0.0, 1.0, n)
+    )
+
+def _gen_co2(rng, timestamps, n):
+    """CO2 levels with higher values during work hours"""
+    hours = _hours_of_day(timestamps)
+    return _banded_draws(
+        _CO2_LO_LUT, _CO2_HI_LUT, hours, rng.uniform(0.0, 1.0, n)
+    )
+
+def _gen_occupancy(rng, timestamps, n):
+    """Occupancy with higher values during weekday work hours"""
+    hours = _hours_of_day(timestamps)
+    weekdays = _weekdays(timestamps)
+    return rng.integers(
+        _OCC_LO_LUT[weekdays, hours], _OCC_HI_LUT[weekdays, hours]
+    )
+
+
+class SimulatedBackend:
+    """Mixin providing synthesized history for the demo platforms.
+
+    A platform declares which sensor types it simulates in _SYNTH_SPECS,
+    mapping sensor type -> (unit, generator); the single _synth_payload
+    here serves every platform, so the vectorized generation path is
+    written and optimized exactly once.
+    """
+
+    _SYNTH_SPECS = {}
+
+    def _synth_payload(self, sensor_id, timestamps):
+        """Synthesize demo values for this platform over a timestamp grid"""
+        spec = self._SYNTH_SPECS.get(_sensor_type(sensor_id))
+        if spec is None:
+            return _columns(sensor_id, timestamps[:0], np.empty(0), '')
+        unit, generate = spec
+        values = generate(self._rng, timestamps, len(timestamps))
+        return _columns(sensor_id, timestamps, values, unit)
+
 
 class IoTPlatform:
     """Base class for IoT platform integrations"""
@@ -12,6 +322,9 @@ class IoTPlatform:
     def __init__(self, connection_params):
         self.connection_params = connection_params
         self.connected = False
+        # One PCG64 generator per instance: no module-level lock, and the
+        # simulated platforms draw whole arrays from it in single C calls
+        self._rng = np.random.default_rng()
     
     def test_connection(self):
         """Test connection to the platform"""
@@ -24,14 +337,113 @@ class IoTPlatform:
     def get_latest_data(self, sensor_id):
         """Get latest data for a sensor"""
         raise NotImplementedError("Subclasses must implement get_latest_data()")
+
+    # Whether get_latest_data leaves the interpreter for network I/O;
+    # get_latest_data_many only fans out over threads when it does
+    io_bound = False
+
+    def get_latest_data_many(self, sensor_ids):
+        """Get latest data for several sensors at once.
+
+        I/O-bound platforms overlap the per-sensor fetches on a thread
+        pool (saturating the pooled HTTP connections); purely simulated
+        backends gain nothing from threads and just loop.
+        """
+        sensor_ids = list(sensor_ids)
+        if self.io_bound and len(sensor_ids) > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(16, len(sensor_ids))
+            ) as executor:
+                return list(executor.map(self.get_latest_data, sensor_ids))
+        return [self.get_latest_data(sensor_id) for sensor_id in sensor_ids]
     
-    def get_historical_data(self, sensor_id, start_time, end_time):
-        """Get historical data for a sensor within time range"""
+    # (gap_min, gap_max) minutes between simulated historical samples
+    _GAP_RANGE = (1, 5)
+
+    def get_historical_data(self, sensor_id, start_time, end_time, fmt='columns'):
+        """Get historical data for a sensor within time range.
+
+        The default 'columns' format returns one payload dict per call
+        with NumPy timestamp/value arrays (see _columns); fmt='rows'
+        returns the legacy list of per-sample dicts.
+        """
         raise NotImplementedError("Subclasses must implement get_historical_data()")
 
+    def get_historical_data_bulk(self, sensor_ids, start_time, end_time):
+        """Get historical data for several sensors over one time window.
+
+        The timestamp grid is generated once and every sensor's values are
+        synthesized against it, amortizing the timeline work across the
+        whole request. Returns one columnar payload per sensor id.
+        """
+        timestamps = _random_timeline(self._rng, start_time, end_time, *self._GAP_RANGE)
+        return [
+            self._synth_payload(sensor_id, timestamps)
+            for sensor_id in sensor_ids
+        ]
+
+    def _synth_payload(self, sensor_id, timestamps):
+        """Synthesize demo values for a timestamp grid (simulated platforms)"""
+        raise NotImplementedError("Subclasses must implement _synth_payload()")
 
-class AWSIoTPlatform(IoTPlatform):
+    def close(self):
+        """Release any connections held by the platform"""
+        self.connected = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+
+# Demo sensor catalogs are constant, so they are built once at module load
+# as immutable views instead of fresh dict literals on every discover call
+_AWS_SENSORS = tuple(MappingProxyType(s) for s in [
+    {
+        'id': 'aws-temp-001',
+        'name': 'AWS Temperature Sensor 1',
+        'type': 'temperature',
+        'location': 'Living Room',
+        'metadata': {
+            'manufacturer': 'AWS',
+            'model': 'TempSensor',
+            'firmware': '1.2.3'
+        }
+    },
+    {
+        'id': 'aws-humid-001',
+        'name': 'AWS Humidity Sensor 1',
+        'type': 'humidity',
+        'location': 'Living Room',
+        'metadata': {
+            'manufacturer': 'AWS',
+            'model': 'HumidSensor',
+            'firmware': '1.1.0'
+        }
+    },
+    {
+        'id': 'aws-motion-001',
+        'name': 'AWS Motion Sensor 1',
+        'type': 'motion',
+        'location': 'Entrance',
+        'metadata': {
+            'manufacturer': 'AWS',
+            'model': 'MotionSensor',
+            'firmware': '2.0.1'
+        }
+    }
+])
+
+class AWSIoTPlatform(SimulatedBackend, IoTPlatform):
     """AWS IoT Core platform integration"""
+
+    _SYNTH_SPECS = {
+        'temperature': (_UNIT_C, _gen_temperature),
+        'humidity': (_UNIT_PCT, _gen_humidity),
+        'motion': (_UNIT_BINARY, _gen_motion),
+    }
     
     def __init__(self, connection_params):
         super().__init__(connection_params)
@@ -65,45 +477,11 @@ class AWSIoTPlatform(IoTPlatform):
     def discover_sensors(self):
         """Discover available sensors from AWS IoT"""
         # In a real implementation, we would query AWS IoT for devices and their shadows
-        # For demonstration, return some sample sensors
+        # For demonstration, return the prebuilt sample sensors
         if not self.connected:
             return []
-        
-        return [
-            {
-                'id': 'aws-temp-001',
-                'name': 'AWS Temperature Sensor 1',
-                'type': 'temperature',
-                'location': 'Living Room',
-                'metadata': {
-                    'manufacturer': 'AWS',
-                    'model': 'TempSensor',
-                    'firmware': '1.2.3'
-                }
-            },
-            {
-                'id': 'aws-humid-001',
-                'name': 'AWS Humidity Sensor 1',
-                'type': 'humidity',
-                'location': 'Living Room',
-                'metadata': {
-                    'manufacturer': 'AWS',
-                    'model': 'HumidSensor',
-                    'firmware': '1.1.0'
-                }
-            },
-            {
-                'id': 'aws-motion-001',
-                'name': 'AWS Motion Sensor 1',
-                'type': 'motion',
-                'location': 'Entrance',
-                'metadata': {
-                    'manufacturer': 'AWS',
-                    'model': 'MotionSensor',
-                    'firmware': '2.0.1'
-                }
-            }
-        ]
+
+        return list(_AWS_SENSORS)
     
     def get_latest_data(self, sensor_id):
         """Get latest data for an AWS IoT sensor"""
@@ -112,79 +490,80 @@ class AWSIoTPlatform(IoTPlatform):
         
         # In a real implementation, we would query the device shadow
         # For demonstration, generate plausible data
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = int(time.time())
+        stype = _sensor_type(sensor_id)
         
-        if 'temp' in sensor_id:
-            value = round(random.uniform(18.0, 26.0), 1)
-            return {
-                'sensor_id': sensor_id,
-                'timestamp': timestamp,
-                'value': value,
-                'unit': '°C'
-            }
-        elif 'humid' in sensor_id:
-            value = round(random.uniform(30.0, 70.0), 1)
-            return {
-                'sensor_id': sensor_id,
-                'timestamp': timestamp,
-                'value': value,
-                'unit': '%'
-            }
-        elif 'motion' in sensor_id:
-            value = random.choice([0, 1])
-            return {
-                'sensor_id': sensor_id,
-                'timestamp': timestamp,
-                'value': value,
-                'unit': 'binary'
-            }
+        if stype == 'temperature':
+            value = round(float(self._rng.uniform(18.0, 26.0)), 1)
+            return _reading(sensor_id, timestamp, value, _UNIT_C)
+        elif stype == 'humidity':
+            value = round(float(self._rng.uniform(30.0, 70.0)), 1)
+            return _reading(sensor_id, timestamp, value, _UNIT_PCT)
+        elif stype == 'motion':
+            value = int(self._rng.integers(0, 2))
+            return _reading(sensor_id, timestamp, value, _UNIT_BINARY)
         else:
             raise Exception(f"Unknown sensor type for ID: {sensor_id}")
     
-    def get_historical_data(self, sensor_id, start_time, end_time):
+    def get_historical_data(self, sensor_id, start_time, end_time, fmt='columns'):
         """Get historical data for an AWS IoT sensor"""
         if not self.connected:
             raise Exception("Not connected to AWS IoT")
         
         # In a real implementation, we would query AWS TimeStream or similar
-        # For demonstration, generate plausible historical data
-        data = []
-        current_time = start_time
-        
-        while current_time <= end_time:
-            if 'temp' in sensor_id:
-                value = round(random.uniform(18.0, 26.0), 1)
-                data.append({
-                    'sensor_id': sensor_id,
-                    'timestamp': current_time.strftime("%Y-%m-%d %H:%M:%S"),
-                    'value': value,
-                    'unit': '°C'
-                })
-            elif 'humid' in sensor_id:
-                value = round(random.uniform(30.0, 70.0), 1)
-                data.append({
-                    'sensor_id': sensor_id,
-                    'timestamp': current_time.strftime("%Y-%m-%d %H:%M:%S"),
-                    'value': value,
-                    'unit': '%'
-                })
-            elif 'motion' in sensor_id:
-                value = random.choice([0, 1])
-                data.append({
-                    'sensor_id': sensor_id,
-                    'timestamp': current_time.strftime("%Y-%m-%d %H:%M:%S"),
-                    'value': value,
-                    'unit': 'binary'
-                })
-            
-            # Increment by a random number of minutes (1-5) to simulate irregular data
-            current_time += timedelta(minutes=random.randint(1, 5))
-        
-        return data
+        # For demonstration, generate plausible historical data in one
+        # vectorized pass (random 1-5 minute gaps simulate irregular data)
+        timestamps = _random_timeline(self._rng, start_time, end_time, *self._GAP_RANGE)
+        payload = self._synth_payload(sensor_id, timestamps)
+        if fmt == 'rows':
+            return list(iter_rows(payload))
+        return payload
+
 
+_AZURE_SENSORS = tuple(MappingProxyType(s) for s in [
+    {
+        'id': 'azure-temp-001',
+        'name': 'Azure Temperature Sensor 1',
+        'type': 'temperature',
+        'location': 'Kitchen',
+        'metadata': {
+            'manufacturer': 'Microsoft',
+            'model': 'AzureTempSensor',
+            'firmware': '2.1.3'
+        }
+    },
+    {
+        'id': 'azure-pressure-001',
+        'name': 'Azure Pressure Sensor 1',
+        'type': 'pressure',
+        'location': 'Outdoor',
+        'metadata': {
+            'manufacturer': 'Microsoft',
+            'model': 'AzurePressureSensor',
+            'firmware': '1.0.5'
+        }
+    },
+    {
+        'id': 'azure-light-001',
+        'name': 'Azure Light Sensor 1',
+        'type': 'light',
+        'location': 'Living Room',
+        'metadata': {
+            'manufacturer': 'Microsoft',
+            'model': 'AzureLightSensor',
+            'firmware': '1.2.0'
+        }
+    }
+])
 
-class AzureIoTPlatform(IoTPlatform):
+class AzureIoTPlatform(SimulatedBackend, IoTPlatform):
     """Azure IoT Hub platform integration"""
+
+    _SYNTH_SPECS = {
+        'temperature': (_UNIT_C, _gen_temperature_diurnal),
+        'pressure': (_UNIT_HPA, _gen_pressure),
+        'light': (_UNIT_LUX, _gen_light),
+    }
     
     def __init__(self, connection_params):
         super().__init__(connection_params)
@@ -210,43 +589,9 @@ class AzureIoTPlatform(IoTPlatform):
         """Discover available sensors from Azure IoT Hub"""
         if not self.connected:
             return []
-        
-        # Sample sensors for demonstration
-        return [
-            {
-                'id': 'azure-temp-001',
-                'name': 'Azure Temperature Sensor 1',
-                'type': 'temperature',
-                'location': 'Kitchen',
-                'metadata': {
-                    'manufacturer': 'Microsoft',
-                    'model': 'AzureTempSensor',
-                    'firmware': '2.1.3'
-                }
-            },
-            {
-                'id': 'azure-pressure-001',
-                'name': 'Azure Pressure Sensor 1',
-                'type': 'pressure',
-                'location': 'Outdoor',
-                'metadata': {
-                    'manufacturer': 'Microsoft',
-                    'model': 'AzurePressureSensor',
-                    'firmware': '1.0.5'
-                }
-            },
-            {
-                'id': 'azure-light-001',
-                'name': 'Azure Light Sensor 1',
-                'type': 'light',
-                'location': 'Living Room',
-                'metadata': {
-                    'manufacturer': 'Microsoft',
-                    'model': 'AzureLightSensor',
-                    'firmware': '1.2.0'
-                }
-            }
-        ]
+
+        # Prebuilt sample sensors for demonstration
+        return list(_AZURE_SENSORS)
     
     def get_latest_data(self, sensor_id):
         """Get latest data for an Azure IoT sensor"""
@@ -254,92 +599,51 @@ class AzureIoTPlatform(IoTPlatform):
             raise Exception("Not connected to Azure IoT Hub")
         
         # Generate plausible data for demonstration
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = int(time.time())
+        stype = _sensor_type(sensor_id)
         
-        if 'temp' in sensor_id:
-            value = round(random.uniform(18.0, 26.0), 1)
-            return {
-                'sensor_id': sensor_id,
-                'timestamp': timestamp,
-                'value': value,
-                'unit': '°C'
-            }
-        elif 'pressure' in sensor_id:
-            value = round(random.uniform(980.0, 1020.0), 1)
-            return {
-                'sensor_id': sensor_id,
-                'timestamp': timestamp,
-                'value': value,
-                'unit': 'hPa'
-            }
-        elif 'light' in sensor_id:
-            value = round(random.uniform(0, 1000), 0)
-            return {
-                'sensor_id': sensor_id,
-                'timestamp': timestamp,
-                'value': value,
-                'unit': 'lux'
-            }
+        if stype == 'temperature':
+            value = round(float(self._rng.uniform(18.0, 26.0)), 1)
+            return _reading(sensor_id, timestamp, value, _UNIT_C)
+        elif stype == 'pressure':
+            value = round(float(self._rng.uniform(980.0, 1020.0)), 1)
+            return _reading(sensor_id, timestamp, value, _UNIT_HPA)
+        elif stype == 'light':
+            value = round(float(self._rng.uniform(0, 1000)), 0)
+            return _reading(sensor_id, timestamp, value, _UNIT_LUX)
         else:
             raise Exception(f"Unknown sensor type for ID: {sensor_id}")
     
-    def get_historical_data(self, sensor_id, start_time, end_time):
+    def get_historical_data(self, sensor_id, start_time, end_time, fmt='columns'):
         """Get historical data for an Azure IoT sensor"""
         if not self.connected:
             raise Exception("Not connected to Azure IoT Hub")
         
-        # Generate plausible historical data
-        data = []
-        current_time = start_time
-        
-        while current_time <= end_time:
-            if 'temp' in sensor_id:
-                # Simulate a temperature pattern through the day
-                hour = current_time.hour
-                base_temp = 20.0 + (hour - 12) * 0.5 if hour > 12 else 20.0 - (12 - hour) * 0.2
-                value = round(base_temp + random.uniform(-1.0, 1.0), 1)
-                data.append({
-                    'sensor_id': sensor_id,
-                    'timestamp': current_time.strftime("%Y-%m-%d %H:%M:%S"),
-                    'value': value,
-                    'unit': '°C'
-                })
-            elif 'pressure' in sensor_id:
-                value = round(random.uniform(980.0, 1020.0), 1)
-                data.append({
-                    'sensor_id': sensor_id,
-                    'timestamp': current_time.strftime("%Y-%m-%d %H:%M:%S"),
-                    'value': value,
-                    'unit': 'hPa'
-                })
-            elif 'light' in sensor_id:
-                # Simulate day/night cycle
-                hour = current_time.hour
-                if 6 <= hour <= 18:  # Daytime
-                    value = round(random.uniform(300, 1000), 0)
-                else:  # Nighttime
-                    value = round(random.uniform(0, 50), 0)
-                
-                data.append({
-                    'sensor_id': sensor_id,
-                    'timestamp': current_time.strftime("%Y-%m-%d %H:%M:%S"),
-                    'value': value,
-                    'unit': 'lux'
-                })
-            
-            current_time += timedelta(minutes=random.randint(1, 5))
-        
-        return data
+        # Generate plausible historical data in one vectorized pass
+        timestamps = _random_timeline(self._rng, start_time, end_time, *self._GAP_RANGE)
+        payload = self._synth_payload(sensor_id, timestamps)
+        if fmt == 'rows':
+            return list(iter_rows(payload))
+        return payload
 
 
-class ThingSpeakPlatform(IoTPlatform):
+class ThingSpeakPlatform(SimulatedBackend, IoTPlatform):
     """ThingSpeak IoT platform integration"""
+
+    _GAP_RANGE = (5, 10)
+    io_bound = True
+    _SYNTH_SPECS = {
+        'temperature': (_UNIT_C, _gen_temperature),
+        'humidity': (_UNIT_PCT, _gen_humidity),
+    }
     
     def __init__(self, connection_params):
         super().__init__(connection_params)
         self.api_key = connection_params.get('api_key', '')
         self.channel_id = connection_params.get('channel_id', '')
         self.base_url = "https://api.thingspeak.com"
+        self._session = _pooled_session()
+        self._sensors = None
     
     def test_connection(self):
         """Test connection to ThingSpeak"""
@@ -360,29 +664,32 @@ class ThingSpeakPlatform(IoTPlatform):
             return []
         
         # In a real implementation, we would query the channel feed to determine available fields
-        # For demonstration, return sample sensors
-        return [
-            {
-                'id': f'ts-temp-{self.channel_id}',
-                'name': 'ThingSpeak Temperature Sensor',
-                'type': 'temperature',
-                'location': 'Bedroom',
-                'metadata': {
-                    'channel_id': self.channel_id,
-                    'field': 'field1'
+        # For demonstration, return sample sensors, built once per instance
+        # since the ids depend on the channel
+        if self._sensors is None:
+            self._sensors = [
+                {
+                    'id': f'ts-temp-{self.channel_id}',
+                    'name': 'ThingSpeak Temperature Sensor',
+                    'type': 'temperature',
+                    'location': 'Bedroom',
+                    'metadata': {
+                        'channel_id': self.channel_id,
+                        'field': 'field1'
+                    }
+                },
+                {
+                    'id': f'ts-humid-{self.channel_id}',
+                    'name': 'ThingSpeak Humidity Sensor',
+                    'type': 'humidity',
+                    'location': 'Bedroom',
+                    'metadata': {
+                        'channel_id': self.channel_id,
+                        'field': 'field2'
+                    }
                 }
-            },
-            {
-                'id': f'ts-humid-{self.channel_id}',
-                'name': 'ThingSpeak Humidity Sensor',
-                'type': 'humidity',
-                'location': 'Bedroom',
-                'metadata': {
-                    'channel_id': self.channel_id,
-                    'field': 'field2'
-                }
-            }
-        ]
+            ]
+        return self._sensors
     
     def get_latest_data(self, sensor_id):
         """Get latest data for a ThingSpeak sensor"""
@@ -390,61 +697,167 @@ class ThingSpeakPlatform(IoTPlatform):
             raise Exception("Not connected to ThingSpeak")
         
         # For demonstration, generate plausible data
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = int(time.time())
+        stype = _sensor_type(sensor_id)
         
-        if 'temp' in sensor_id:
-            value = round(random.uniform(18.0, 26.0), 1)
-            return {
-                'sensor_id': sensor_id,
-                'timestamp': timestamp,
-                'value': value,
-                'unit': '°C'
-            }
-        elif 'humid' in sensor_id:
-            value = round(random.uniform(30.0, 70.0), 1)
-            return {
-                'sensor_id': sensor_id,
-                'timestamp': timestamp,
-                'value': value,
-                'unit': '%'
-            }
+        if stype == 'temperature':
+            value = round(float(self._rng.uniform(18.0, 26.0)), 1)
+            return _reading(sensor_id, timestamp, value, _UNIT_C)
+        elif stype == 'humidity':
+            value = round(float(self._rng.uniform(30.0, 70.0)), 1)
+            return _reading(sensor_id, timestamp, value, _UNIT_PCT)
         else:
             raise Exception(f"Unknown sensor type for ID: {sensor_id}")
     
-    def get_historical_data(self, sensor_id, start_time, end_time):
+    def get_historical_data(self, sensor_id, start_time, end_time, fmt='columns'):
         """Get historical data for a ThingSpeak sensor"""
         if not self.connected:
             raise Exception("Not connected to ThingSpeak")
         
-        # Generate plausible historical data
-        data = []
-        current_time = start_time
-        
-        while current_time <= end_time:
-            if 'temp' in sensor_id:
-                value = round(random.uniform(18.0, 26.0), 1)
-                data.append({
-                    'sensor_id': sensor_id,
-                    'timestamp': current_time.strftime("%Y-%m-%d %H:%M:%S"),
-                    'value': value,
-                    'unit': '°C'
-                })
-            elif 'humid' in sensor_id:
-                value = round(random.uniform(30.0, 70.0), 1)
-                data.append({
-                    'sensor_id': sensor_id,
-                    'timestamp': current_time.strftime("%Y-%m-%d %H:%M:%S"),
-                    'value': value,
-                    'unit': '%'
-                })
-            
-            current_time += timedelta(minutes=random.randint(5, 10))
-        
-        return data
+        # Generate plausible historical data in one vectorized pass
+        timestamps = _random_timeline(self._rng, start_time, end_time, *self._GAP_RANGE)
+        payload = self._synth_payload(sensor_id, timestamps)
+        if fmt == 'rows':
+            return list(iter_rows(payload))
+        return payload
+
+    def __del__(self):
+        """Close the pooled HTTP session on deletion"""
+        if getattr(self, '_session', None) is not None:
+            self._session.close()
 
 
-class MQTTPlatform(IoTPlatform):
+class _TopicTrie:
+    """Match MQTT topics against subscription patterns in O(segments).
+
+    Exact (wildcard-free) patterns live in a flat dict, so the common case
+    is a single hash lookup; only patterns containing '+' or '#' descend
+    the tree of '/'-separated segments. A None key on a node marks the end
+    of a pattern and holds the values registered for it.
+    """
+
+    __slots__ = ('_exact', '_root')
+
+    def __init__(self):
+        self._exact = {}
+        self._root = {}
+
+    def insert(self, pattern, value):
+        """Register a value under a topic pattern"""
+        if '+' not in pattern and '#' not in pattern:
+            self._exact.setdefault(pattern, []).append(value)
+            return
+        node = self._root
+        for segment in pattern.split('/'):
+            node = node.setdefault(segment, {})
+        node.setdefault(None, []).append(value)
+
+    def match(self, topic):
+        """Return every value whose pattern matches the topic"""
+        matches = list(self._exact.get(topic, ()))
+        if self._root:
+            self._descend(self._root, topic.split('/'), 0, matches)
+        return matches
+
+    def _descend(self, node, segments, i, out):
+        # '#' matches the rest of the topic, including zero levels
+        if '#' in node:
+            out.extend(node['#'].get(None, ()))
+        if i == len(segments):
+            out.extend(node.get(None, ()))
+            return
+        child = node.get(segments[i])
+        if child is not None:
+            self._descend(child, segments, i + 1, out)
+        plus = node.get('+')
+        if plus is not None:
+            self._descend(plus, segments, i + 1, out)
+
+
+class _MqttHub:
+    """Single dispatcher thread servicing every MQTT client's network I/O.
+
+    paho's loop_start() spawns one background thread per client, so a
+    dashboard talking to many brokers pays one thread per connection. The
+    hub instead multiplexes every registered client over one selector,
+    pumping loop_read on socket events and loop_write/loop_misc (pending
+    sends, keepalives, retries) on a 1 Hz heartbeat.
+    """
+
+    _HEARTBEAT = 1.0
+
+    def __init__(self):
+        self._selector = selectors.DefaultSelector()
+        self._clients = {}
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def register(self, client):
+        """Start servicing a connected client's socket"""
+        sock = client.socket()
+        with self._lock:
+            self._clients[sock] = client
+            self._selector.register(sock, selectors.EVENT_READ, client)
+            # The dispatcher thread is started lazily on first registration
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name='mqtt-hub', daemon=True
+                )
+                self._thread.start()
+
+    def unregister(self, client):
+        """Stop servicing a client before it is disconnected"""
+        with self._lock:
+            for sock, registered in list(self._clients.items()):
+                if registered is client:
+                    del self._clients[sock]
+                    try:
+                        self._selector.unregister(sock)
+                    except KeyError:
+                        pass
+
+    def _run(self):
+        while True:
+            events = self._selector.select(timeout=self._HEARTBEAT)
+            for key, _ in events:
+                try:
+                    key.data.loop_read()
+                except Exception as e:
+                    print(f"Error reading MQTT socket: {str(e)}")
+            with self._lock:
+                clients = list(self._clients.values())
+            for client in clients:
+                try:
+                    if client.want_write():
+                        client.loop_write()
+                    client.loop_misc()
+                except Exception as e:
+                    print(f"Error servicing MQTT client: {str(e)}")
+
+# All MQTTPlatform instances share one hub (and thus one network thread)
+_MQTT_HUB = _MqttHub()
+
+def _close_mqtt_client(client):
+    """Detach a client from the hub and disconnect it.
+
+    Used both by MQTTPlatform.close and as a weakref finalizer, so it must
+    tolerate half-initialized clients and interpreter shutdown.
+    """
+    try:
+        _MQTT_HUB.unregister(client)
+        client.disconnect()
+    except Exception:
+        pass
+
+
+class MQTTPlatform(SimulatedBackend, IoTPlatform):
     """MQTT broker platform integration"""
+
+    _GAP_RANGE = (1, 3)
+    _SYNTH_SPECS = {
+        'temperature': (_UNIT_C, _gen_temperature),
+        'humidity': (_UNIT_PCT, _gen_humidity),
+    }
     
     def __init__(self, connection_params):
         super().__init__(connection_params)
@@ -455,7 +868,15 @@ class MQTTPlatform(IoTPlatform):
         self.client_id = f"iot-dashboard-{int(time.time())}"
         self.topics = connection_params.get('topics', 'sensors/#').split(',')
         self.client = None
-        self.messages = {}
+        # Bounded ring of (time_ns, raw payload bytes) per topic; the
+        # newest 1024 messages are kept and older ones fall off the end
+        self._topic_rings = defaultdict(lambda: deque(maxlen=1024))
+        # Topic pattern -> sensor routing, built with the sensor catalog;
+        # _latest holds the newest matched (time_ns, payload) per sensor
+        self._trie = None
+        self._latest = {}
+        self._finalizer = None
+        self._sensors = None
     
     def test_connection(self):
         """Test connection to MQTT broker"""
@@ -471,9 +892,17 @@ class MQTTPlatform(IoTPlatform):
             self.client.on_connect = self._on_connect
             self.client.on_message = self._on_message
             
-            # Connect with a short timeout
+            # Connect with a short timeout, then hand the socket to the
+            # shared hub instead of spawning a per-client loop thread
             self.client.connect(self.broker, self.port, 10)
-            self.client.loop_start()
+            _MQTT_HUB.register(self.client)
+
+            # Best-effort cleanup if the platform is dropped without
+            # close(); unlike __del__, finalize never runs against a
+            # half-built instance or blocks interpreter shutdown
+            self._finalizer = weakref.finalize(
+                self, _close_mqtt_client, self.client
+            )
             
             # Wait a moment for connection to establish
             time.sleep(2)
@@ -481,12 +910,12 @@ class MQTTPlatform(IoTPlatform):
             if self.connected:
                 return True
             else:
-                self.client.loop_stop()
+                _MQTT_HUB.unregister(self.client)
                 return False
         except Exception as e:
             print(f"Error connecting to MQTT broker: {str(e)}")
             if self.client:
-                self.client.loop_stop()
+                _MQTT_HUB.unregister(self.client)
             return False
     
     def _on_connect(self, client, userdata, flags, rc):
@@ -500,15 +929,41 @@ class MQTTPlatform(IoTPlatform):
             self.connected = False
     
     def _on_message(self, client, userdata, msg):
-        """Callback when MQTT client receives a message"""
-        try:
-            # Store received message
-            self.messages[msg.topic] = {
-                'payload': msg.payload.decode('utf-8'),
-                'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            }
-        except Exception as e:
-            print(f"Error processing MQTT message: {str(e)}")
+        """Callback when MQTT client receives a message.
+
+        Runs on the shared network thread, so it only appends the raw
+        payload bytes to the topic's ring: no decode, no timestamp
+        formatting, no per-message dict. Payloads are interpreted lazily
+        when a reader asks for them via latest_message.
+        """
+        record = (time.time_ns(), msg.payload)
+        self._topic_rings[msg.topic].append(record)
+        if self._trie is not None:
+            for sensor_id in self._trie.match(msg.topic):
+                self._latest[sensor_id] = record
+
+    def latest_message(self, topic):
+        """Return the newest (time_ns, payload str) for a topic, or None"""
+        ring = self._topic_rings.get(topic)
+        if not ring:
+            return None
+        ts_ns, payload = ring[-1]
+        return ts_ns, payload.decode('utf-8')
+
+    def latest_json(self, topic):
+        """Return the newest payload for a topic parsed as JSON, or None.
+
+        Payloads are kept as raw bytes in the ring; parsing happens here at
+        read time, with orjson when available so the UTF-8 decode and the
+        JSON parse collapse into one C pass over the bytes.
+        """
+        ring = self._topic_rings.get(topic)
+        if not ring:
+            return None
+        payload = ring[-1][1]
+        if orjson is not None:
+            return orjson.loads(payload)
+        return json.loads(payload)
     
     def discover_sensors(self):
         """Discover available sensors from MQTT topics"""
@@ -516,9 +971,14 @@ class MQTTPlatform(IoTPlatform):
             return []
         
         # For a real implementation, we would analyze MQTT topics and messages
-        # For demonstration, return some sample sensors based on topics
+        # For demonstration, return some sample sensors based on topics,
+        # built once per instance
+        if self._sensors is not None:
+            return self._sensors
+
         sensors = []
-        
+        trie = _TopicTrie()
+
         # Add some sample sensors based on topics
         for i, topic in enumerate(self.topics):
             topic_parts = topic.split('/')
@@ -534,6 +994,7 @@ class MQTTPlatform(IoTPlatform):
                     'topic': f"{topic}/temperature"
                 }
             })
+            trie.insert(f"{topic}/temperature", f'mqtt-temp-{i+1}')
             
             # Create humidity sensor
             sensors.append({
@@ -545,7 +1006,10 @@ class MQTTPlatform(IoTPlatform):
                     'topic': f"{topic}/humidity"
                 }
             })
-        
+            trie.insert(f"{topic}/humidity", f'mqtt-humid-{i+1}')
+
+        self._trie = trie
+        self._sensors = sensors
         return sensors
     
     def get_latest_data(self, sensor_id):
@@ -555,68 +1019,60 @@ class MQTTPlatform(IoTPlatform):
         
         # For a real implementation, we would look up the latest message for this sensor's topic
         # For demonstration, generate plausible data
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = int(time.time())
+        stype = _sensor_type(sensor_id)
         
-        if 'temp' in sensor_id:
-            value = round(random.uniform(18.0, 26.0), 1)
-            return {
-                'sensor_id': sensor_id,
-                'timestamp': timestamp,
-                'value': value,
-                'unit': '°C'
-            }
-        elif 'humid' in sensor_id:
-            value = round(random.uniform(30.0, 70.0), 1)
-            return {
-                'sensor_id': sensor_id,
-                'timestamp': timestamp,
-                'value': value,
-                'unit': '%'
-            }
+        if stype == 'temperature':
+            value = round(float(self._rng.uniform(18.0, 26.0)), 1)
+            return _reading(sensor_id, timestamp, value, _UNIT_C)
+        elif stype == 'humidity':
+            value = round(float(self._rng.uniform(30.0, 70.0)), 1)
+            return _reading(sensor_id, timestamp, value, _UNIT_PCT)
         else:
             raise Exception(f"Unknown sensor type for ID: {sensor_id}")
     
-    def get_historical_data(self, sensor_id, start_time, end_time):
+    def get_historical_data(self, sensor_id, start_time, end_time, fmt='columns'):
         """Get historical data for an MQTT sensor"""
         if not self.connected:
             raise Exception("Not connected to MQTT broker")
         
         # MQTT doesn't natively store historical data, would typically be saved elsewhere
-        # For demonstration, generate plausible historical data
-        data = []
-        current_time = start_time
-        
-        while current_time <= end_time:
-            if 'temp' in sensor_id:
-                value = round(random.uniform(18.0, 26.0), 1)
-                data.append({
-                    'sensor_id': sensor_id,
-                    'timestamp': current_time.strftime("%Y-%m-%d %H:%M:%S"),
-                    'value': value,
-                    'unit': '°C'
-                })
-            elif 'humid' in sensor_id:
-                value = round(random.uniform(30.0, 70.0), 1)
-                data.append({
-                    'sensor_id': sensor_id,
-                    'timestamp': current_time.strftime("%Y-%m-%d %H:%M:%S"),
-                    'value': value,
-                    'unit': '%'
-                })
-            
-            current_time += timedelta(minutes=random.randint(1, 3))
-        
-        return data
+        # For demonstration, generate plausible historical data in one
+        # vectorized pass
+        timestamps = _random_timeline(self._rng, start_time, end_time, *self._GAP_RANGE)
+        payload = self._synth_payload(sensor_id, timestamps)
+        if fmt == 'rows':
+            return list(iter_rows(payload))
+        return payload
     
-    def __del__(self):
-        """Clean up MQTT client connection on deletion"""
-        if self.client:
-            self.client.loop_stop()
-            self.client.disconnect()
+    def close(self):
+        """Disconnect from the broker and stop servicing its socket"""
+        if self._finalizer is not None:
+            # Runs _close_mqtt_client exactly once; detaches the finalizer
+            self._finalizer()
+            self._finalizer = None
+        self.client = None
+        self.connected = False
+
 
+_API_SENSOR_SPECS = (
+    ('api-temp-001', 'API Temperature Sensor 1', 'temperature', 'Office',
+     '/sensors/temperature/1'),
+    ('api-co2-001', 'API CO2 Sensor 1', 'co2', 'Office', '/sensors/co2/1'),
+    ('api-occupancy-001', 'API Occupancy Sensor 1', 'occupancy',
+     'Conference Room', '/sensors/occupancy/1'),
+)
 
-class CustomAPIPlatform(IoTPlatform):
+class CustomAPIPlatform(SimulatedBackend, IoTPlatform):
     """Custom REST API platform integration"""
+
+    _GAP_RANGE = (5, 15)
+    io_bound = True
+    _SYNTH_SPECS = {
+        'temperature': (_UNIT_C, _gen_temperature),
+        'co2': (_UNIT_PPM, _gen_co2),
+        'occupancy': (_UNIT_PEOPLE, _gen_occupancy),
+    }
     
     def __init__(self, connection_params):
         super().__init__(connection_params)
@@ -624,6 +1080,8 @@ class CustomAPIPlatform(IoTPlatform):
         self.api_key = connection_params.get('api_key', '')
         self.username = connection_params.get('username', '')
         self.password = connection_params.get('password', '')
+        self._session = _pooled_session()
+        self._sensors = None
     
     def test_connection(self):
         """Test connection to Custom API"""
@@ -642,37 +1100,21 @@ class CustomAPIPlatform(IoTPlatform):
         """Discover available sensors from Custom API"""
         if not self.connected:
             return []
-        
-        # For demonstration, return sample sensors
-        return [
-            {
-                'id': 'api-temp-001',
-                'name': 'API Temperature Sensor 1',
-                'type': 'temperature',
-                'location': 'Office',
-                'metadata': {
-                    'endpoint': f"{self.base_url}/sensors/temperature/1"
-                }
-            },
-            {
-                'id': 'api-co2-001',
-                'name': 'API CO2 Sensor 1',
-                'type': 'co2',
-                'location': 'Office',
-                'metadata': {
-                    'endpoint': f"{self.base_url}/sensors/co2/1"
-                }
-            },
-            {
-                'id': 'api-occupancy-001',
-                'name': 'API Occupancy Sensor 1',
-                'type': 'occupancy',
-                'location': 'Conference Room',
-                'metadata': {
-                    'endpoint': f"{self.base_url}/sensors/occupancy/1"
+
+        # Built once per instance; the endpoint metadata depends on base_url
+        if self._sensors is None:
+            self._sensors = [
+                {
+                    'id': sensor_id,
+                    'name': name,
+                    'type': sensor_type,
+                    'location': location,
+                    'metadata': {'endpoint': f"{self.base_url}{path}"}
                 }
-            }
-        ]
+                for sensor_id, name, sensor_type, location, path
+                in _API_SENSOR_SPECS
+            ]
+        return self._sensors
     
     def get_latest_data(self, sensor_id):
         """Get latest data for a Custom API sensor"""
@@ -680,103 +1122,61 @@ class CustomAPIPlatform(IoTPlatform):
             raise Exception("Not connected to Custom API")
         
         # For demonstration, generate plausible data
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = int(time.time())
+        stype = _sensor_type(sensor_id)
         
-        if 'temp' in sensor_id:
-            value = round(random.uniform(18.0, 26.0), 1)
-            return {
-                'sensor_id': sensor_id,
-                'timestamp': timestamp,
-                'value': value,
-                'unit': '°C'
-            }
-        elif 'co2' in sensor_id:
-            value = round(random.uniform(400.0, 1200.0), 0)
-            return {
-                'sensor_id': sensor_id,
-                'timestamp': timestamp,
-                'value': value,
-                'unit': 'ppm'
-            }
-        elif 'occupancy' in sensor_id:
-            value = random.randint(0, 10)
-            return {
-                'sensor_id': sensor_id,
-                'timestamp': timestamp,
-                'value': value,
-                'unit': 'people'
-            }
+        if stype == 'temperature':
+            value = round(float(self._rng.uniform(18.0, 26.0)), 1)
+            return _reading(sensor_id, timestamp, value, _UNIT_C)
+        elif stype == 'co2':
+            value = round(float(self._rng.uniform(400.0, 1200.0)), 0)
+            return _reading(sensor_id, timestamp, value, _UNIT_PPM)
+        elif stype == 'occupancy':
+            value = int(self._rng.integers(0, 11))
+            return _reading(sensor_id, timestamp, value, _UNIT_PEOPLE)
         else:
             raise Exception(f"Unknown sensor type for ID: {sensor_id}")
     
-    def get_historical_data(self, sensor_id, start_time, end_time):
+    def get_historical_data(self, sensor_id, start_time, end_time, fmt='columns'):
         """Get historical data for a Custom API sensor"""
         if not self.connected:
             raise Exception("Not connected to Custom API")
         
-        # Generate plausible historical data
-        data = []
-        current_time = start_time
-        
-        while current_time <= end_time:
-            if 'temp' in sensor_id:
-                value = round(random.uniform(18.0, 26.0), 1)
-                data.append({
-                    'sensor_id': sensor_id,
-                    'timestamp': current_time.strftime("%Y-%m-%d %H:%M:%S"),
-                    'value': value,
-                    'unit': '°C'
-                })
-            elif 'co2' in sensor_id:
-                # Simulate CO2 levels with higher values during work hours
-                hour = current_time.hour
-                if 8 <= hour <= 18:  # Working hours
-                    value = round(random.uniform(600.0, 1200.0), 0)
-                else:  # Off hours
-                    value = round(random.uniform(400.0, 600.0), 0)
-                
-                data.append({
-                    'sensor_id': sensor_id,
-                    'timestamp': current_time.strftime("%Y-%m-%d %H:%M:%S"),
-                    'value': value,
-                    'unit': 'ppm'
-                })
-            elif 'occupancy' in sensor_id:
-                # Simulate occupancy with higher values during work hours
-                hour = current_time.hour
-                weekday = current_time.weekday()
-                
-                if weekday < 5 and 8 <= hour <= 18:  # Weekday working hours
-                    value = random.randint(1, 10)
-                else:  # Weekend or off hours
-                    value = random.randint(0, 2)
-                
-                data.append({
-                    'sensor_id': sensor_id,
-                    'timestamp': current_time.strftime("%Y-%m-%d %H:%M:%S"),
-                    'value': value,
-                    'unit': 'people'
-                })
-            
-            current_time += timedelta(minutes=random.randint(5, 15))
-        
-        return data
+        # Generate plausible historical data in one vectorized pass
+        timestamps = _random_timeline(self._rng, start_time, end_time, *self._GAP_RANGE)
+        payload = self._synth_payload(sensor_id, timestamps)
+        if fmt == 'rows':
+            return list(iter_rows(payload))
+        return payload
+
+    def __del__(self):
+        """Close the pooled HTTP session on deletion"""
+        if getattr(self, '_session', None) is not None:
+            self._session.close()
 
 
 class IoTPlatformFactory:
     """Factory class to create IoT platform instances"""
-    
+
+    # Display name -> platform class; dispatch is one dict lookup and new
+    # platforms plug in via register() without editing the factory
+    _REGISTRY = {
+        'AWS IoT Core': AWSIoTPlatform,
+        'Azure IoT Hub': AzureIoTPlatform,
+        'ThingSpeak': ThingSpeakPlatform,
+        'MQTT Broker': MQTTPlatform,
+        'Custom API': CustomAPIPlatform,
+    }
+
+    @classmethod
+    def register(cls, name, platform_cls):
+        """Register an additional platform class under a display name"""
+        cls._REGISTRY[name] = platform_cls
+
     def create_platform(self, platform_type, connection_params):
         """Create and return an instance of the specified platform type"""
-        if platform_type == 'AWS IoT Core':
-            return AWSIoTPlatform(connection_params)
-        elif platform_type == 'Azure IoT Hub':
-            return AzureIoTPlatform(connection_params)
-        elif platform_type == 'ThingSpeak':
-            return ThingSpeakPlatform(connection_params)
-        elif platform_type == 'MQTT Broker':
-            return MQTTPlatform(connection_params)
-        elif platform_type == 'Custom API':
-            return CustomAPIPlatform(connection_params)
-        else:
+        try:
+            platform_cls = self._REGISTRY[platform_type]
+        except KeyError:
             raise ValueError(f"Unsupported platform type: {platform_type}")
+        return platform_cls(connection_params)
@@ -1,351 +1,495 @@
 import yaml
 import os
-import random
+import json
+import copy
+import time
+import numpy as np
+
+# Resolve the libyaml-backed loader/dumper once at import; the C
+# implementations parse ~10x faster than the pure-Python fallbacks
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
 from datetime import datetime, timedelta
+from functools import lru_cache
 import pandas as pd
 
+def _load_json_sidecar(sidecar, yaml_mtime_ns):
+    """Read the precompiled JSON copy of a config if it is still current"""
+    try:
+        if os.stat(sidecar).st_mtime_ns < yaml_mtime_ns:
+            return None
+        with open(sidecar, 'rb') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def _write_json_sidecar(sidecar, config):
+    """Write the JSON copy of a parsed config atomically (tmp + rename).
+
+    Cold starts prefer the sidecar because json.load is a C extension and
+    several times faster than even the libyaml parser; a failed write —
+    including configs with YAML-only values like dates that JSON can't
+    serialize — just means the next start parses YAML again.
+    """
+    tmp = f"{sidecar}.tmp{os.getpid()}"
+    try:
+        with open(tmp, 'w') as f:
+            json.dump(config, f)
+        os.replace(tmp, sidecar)
+    except (TypeError, ValueError, OSError):
+        pass
+    finally:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+
+# Parsed configs keyed by absolute path; each entry holds the file's
+# (mtime_ns, size) so edits on disk invalidate the cache automatically
+_CONFIG_CACHE = {}
+
 def load_config(config_file='config.yaml'):
-    """Load configuration from YAML file"""
-    if os.path.exists(config_file):
-        with open(config_file, 'r') as f:
-            config = yaml.safe_load(f)
-    else:
-        # Default configuration
+    """Load configuration from YAML file.
+
+    Repeat loads of an unchanged file are served from an in-process cache
+    and cost one stat call instead of a YAML parse.
+    """
+    path = os.path.abspath(config_file)
+    try:
+        st = os.stat(path)
+    except OSError:
+        # Default configuration, saved for next time
         config = get_default_config()
-        # Save default config
+        # block style and unsorted keys keep the write a single pass in
+        # the order the defaults are defined
         with open(config_file, 'w') as f:
-            yaml.dump(config, f)
-    
+            yaml.dump(
+                config, f, Dumper=_YAML_DUMPER,
+                default_flow_style=False, sort_keys=False
+            )
+        return config
+
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _CONFIG_CACHE.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    # Prefer the JSON sidecar when it is at least as new as the YAML;
+    # otherwise parse the YAML and refresh the sidecar for next time
+    sidecar = os.path.splitext(path)[0] + '.json'
+    config = _load_json_sidecar(sidecar, st.st_mtime_ns)
+    if config is None:
+        # Binary mode lets libyaml consume the bytes directly instead of
+        # going through Python's text codec layer first
+        with open(config_file, 'rb') as f:
+            config = yaml.load(f, Loader=_YAML_LOADER)
+        _write_json_sidecar(sidecar, config)
+    _CONFIG_CACHE[path] = (key, config)
     return config
 
-def get_default_config():
-    """Get default configuration"""
-    return {
-        'app': {
-            'name': 'IoT Sensor Dashboard',
-            'version': '1.0.0',
-            'refresh_interval': 5,  # seconds
-            'max_history_days': 30
-        },
-        'platforms': {
-            'AWS IoT Core': {
-                'description': 'Amazon Web Services IoT Core platform',
-                'connection_params': {
-                    'endpoint': {
-                        'label': 'AWS IoT Endpoint',
-                        'default': '',
-                        'env_var': 'AWS_IOT_ENDPOINT'
-                    },
-                    'region': {
-                        'label': 'AWS Region',
-                        'default': 'us-east-1',
-                        'env_var': 'AWS_REGION'
-                    },
-                    'access_key': {
-                        'label': 'AWS Access Key ID',
-                        'default': '',
-                        'env_var': 'AWS_ACCESS_KEY_ID',
-                        'sensitive': True
-                    },
-                    'secret_key': {
-                        'label': 'AWS Secret Access Key',
-                        'default': '',
-                        'env_var': 'AWS_SECRET_ACCESS_KEY',
-                        'sensitive': True
-                    }
-                }
-            },
-            'Azure IoT Hub': {
-                'description': 'Microsoft Azure IoT Hub',
-                'connection_params': {
-                    'connection_string': {
-                        'label': 'Connection String',
-                        'default': '',
-                        'env_var': 'AZURE_IOT_CONNECTION_STRING',
-                        'sensitive': True
-                    },
-                    'hub_name': {
-                        'label': 'IoT Hub Name',
-                        'default': '',
-                        'env_var': 'AZURE_IOT_HUB_NAME'
-                    }
+# The default configuration, built once at import instead of re-creating
+# the whole nested literal on every call
+_DEFAULT_CONFIG = {
+    'app': {
+        'name': 'IoT Sensor Dashboard',
+        'version': '1.0.0',
+        'refresh_interval': 5,  # seconds
+        'max_history_days': 30
+    },
+    'platforms': {
+        'AWS IoT Core': {
+            'description': 'Amazon Web Services IoT Core platform',
+            'connection_params': {
+                'endpoint': {
+                    'label': 'AWS IoT Endpoint',
+                    'default': '',
+                    'env_var': 'AWS_IOT_ENDPOINT'
+                },
+                'region': {
+                    'label': 'AWS Region',
+                    'default': 'us-east-1',
+                    'env_var': 'AWS_REGION'
+                },
+                'access_key': {
+                    'label': 'AWS Access Key ID',
+                    'default': '',
+                    'env_var': 'AWS_ACCESS_KEY_ID',
+                    'sensitive': True
+                },
+                'secret_key': {
+                    'label': 'AWS Secret Access Key',
+                    'default': '',
+                    'env_var': 'AWS_SECRET_ACCESS_KEY',
+                    'sensitive': True
                 }
-            },
-            'ThingSpeak': {
-                'description': 'ThingSpeak IoT platform',
-                'connection_params': {
-                    'api_key': {
-                        'label': 'API Key',
-                        'default': '',
-                        'env_var': 'THINGSPEAK_API_KEY',
-                        'sensitive': True
-                    },
-                    'channel_id': {
-                        'label': 'Channel ID',
-                        'default': '',
-                        'env_var': 'THINGSPEAK_CHANNEL_ID'
-                    }
-                }
-            },
-            'MQTT Broker': {
-                'description': 'Generic MQTT broker',
-                'connection_params': {
-                    'broker': {
-                        'label': 'Broker Address',
-                        'default': 'mqtt.eclipse.org',
-                        'env_var': 'MQTT_BROKER'
-                    },
-                    'port': {
-                        'label': 'Port',
-                        'default': '1883',
-                        'env_var': 'MQTT_PORT'
-                    },
-                    'username': {
-                        'label': 'Username (optional)',
-                        'default': '',
-                        'env_var': 'MQTT_USERNAME'
-                    },
-                    'password': {
-                        'label': 'Password (optional)',
-                        'default': '',
-                        'env_var': 'MQTT_PASSWORD',
-                        'sensitive': True
-                    },
-                    'topics': {
-                        'label': 'Topics (comma-separated)',
-                        'default': 'sensors/#',
-                        'env_var': 'MQTT_TOPICS'
-                    }
+            }
+        },
+        'Azure IoT Hub': {
+            'description': 'Microsoft Azure IoT Hub',
+            'connection_params': {
+                'connection_string': {
+                    'label': 'Connection String',
+                    'default': '',
+                    'env_var': 'AZURE_IOT_CONNECTION_STRING',
+                    'sensitive': True
+                },
+                'hub_name': {
+                    'label': 'IoT Hub Name',
+                    'default': '',
+                    'env_var': 'AZURE_IOT_HUB_NAME'
                 }
-            },
-            'Custom API': {
-                'description': 'Custom REST API endpoint',
-                'connection_params': {
-                    'base_url': {
-                        'label': 'Base URL',
-                        'default': 'https://api.example.com',
-                        'env_var': 'API_BASE_URL'
-                    },
-                    'api_key': {
-                        'label': 'API Key (optional)',
-                        'default': '',
-                        'env_var': 'API_KEY',
-                        'sensitive': True
-                    },
-                    'username': {
-                        'label': 'Username (optional)',
-                        'default': '',
-                        'env_var': 'API_USERNAME'
-                    },
-                    'password': {
-                        'label': 'Password (optional)',
-                        'default': '',
-                        'env_var': 'API_PASSWORD',
-                        'sensitive': True
-                    }
+            }
+        },
+        'ThingSpeak': {
+            'description': 'ThingSpeak IoT platform',
+            'connection_params': {
+                'api_key': {
+                    'label': 'API Key',
+                    'default': '',
+                    'env_var': 'THINGSPEAK_API_KEY',
+                    'sensitive': True
+                },
+                'channel_id': {
+                    'label': 'Channel ID',
+                    'default': '',
+                    'env_var': 'THINGSPEAK_CHANNEL_ID'
                 }
             }
         },
-        'sensor_types': {
-            'temperature': {
-                'name': 'Temperature',
-                'unit': '°C',
-                'icon': 'thermometer',
-                'min': -50,
-                'max': 150
-            },
-            'humidity': {
-                'name': 'Humidity',
-                'unit': '%',
-                'icon': 'droplet',
-                'min': 0,
-                'max': 100
-            },
-            'pressure': {
-                'name': 'Pressure',
-                'unit': 'hPa',
-                'icon': 'activity',
-                'min': 900,
-                'max': 1100
-            },
-            'co2': {
-                'name': 'CO2',
-                'unit': 'ppm',
-                'icon': 'wind',
-                'min': 0,
-                'max': 5000
-            },
-            'light': {
-                'name': 'Light',
-                'unit': 'lux',
-                'icon': 'sun',
-                'min': 0,
-                'max': 10000
-            },
-            'motion': {
-                'name': 'Motion',
-                'unit': 'binary',
-                'icon': 'activity',
-                'min': 0,
-                'max': 1
-            },
-            'occupancy': {
-                'name': 'Occupancy',
-                'unit': 'count',
-                'icon': 'users',
-                'min': 0,
-                'max': 100
+        'MQTT Broker': {
+            'description': 'Generic MQTT broker',
+            'connection_params': {
+                'broker': {
+                    'label': 'Broker Address',
+                    'default': 'mqtt.eclipse.org',
+                    'env_var': 'MQTT_BROKER'
+                },
+                'port': {
+                    'label': 'Port',
+                    'default': '1883',
+                    'env_var': 'MQTT_PORT'
+                },
+                'username': {
+                    'label': 'Username (optional)',
+                    'default': '',
+                    'env_var': 'MQTT_USERNAME'
+                },
+                'password': {
+                    'label': 'Password (optional)',
+                    'default': '',
+                    'env_var': 'MQTT_PASSWORD',
+                    'sensitive': True
+                },
+                'topics': {
+                    'label': 'Topics (comma-separated)',
+                    'default': 'sensors/#',
+                    'env_var': 'MQTT_TOPICS'
+                }
             }
         },
-        'alerts': {
-            'email': {
-                'enabled': False,
-                'smtp_server': '',
-                'smtp_port': 587,
-                'username': '',
-                'password': '',
-                'from_addr': '',
-                'to_addrs': []
-            },
-            'sms': {
-                'enabled': False,
-                'provider': '',
-                'api_key': '',
-                'phone_numbers': []
+        'Custom API': {
+            'description': 'Custom REST API endpoint',
+            'connection_params': {
+                'base_url': {
+                    'label': 'Base URL',
+                    'default': 'https://api.example.com',
+                    'env_var': 'API_BASE_URL'
+                },
+                'api_key': {
+                    'label': 'API Key (optional)',
+                    'default': '',
+                    'env_var': 'API_KEY',
+                    'sensitive': True
+                },
+                'username': {
+                    'label': 'Username (optional)',
+                    'default': '',
+                    'env_var': 'API_USERNAME'
+                },
+                'password': {
+                    'label': 'Password (optional)',
+                    'default': '',
+                    'env_var': 'API_PASSWORD',
+                    'sensitive': True
+                }
             }
         }
+    },
+    'sensor_types': {
+        'temperature': {
+            'name': 'Temperature',
+            'unit': '°C',
+            'icon': 'thermometer',
+            'min': -50,
+            'max': 150
+        },
+        'humidity': {
+            'name': 'Humidity',
+            'unit': '%',
+            'icon': 'droplet',
+            'min': 0,
+            'max': 100
+        },
+        'pressure': {
+            'name': 'Pressure',
+            'unit': 'hPa',
+            'icon': 'activity',
+            'min': 900,
+            'max': 1100
+        },
+        'co2': {
+            'name': 'CO2',
+            'unit': 'ppm',
+            'icon': 'wind',
+            'min': 0,
+            'max': 5000
+        },
+        'light': {
+            'name': 'Light',
+            'unit': 'lux',
+            'icon': 'sun',
+            'min': 0,
+            'max': 10000
+        },
+        'motion': {
+            'name': 'Motion',
+            'unit': 'binary',
+            'icon': 'activity',
+            'min': 0,
+            'max': 1
+        },
+        'occupancy': {
+            'name': 'Occupancy',
+            'unit': 'count',
+            'icon': 'users',
+            'min': 0,
+            'max': 100
+        }
+    },
+    'alerts': {
+        'email': {
+            'enabled': False,
+            'smtp_server': '',
+            'smtp_port': 587,
+            'username': '',
+            'password': '',
+            'from_addr': '',
+            'to_addrs': []
+        },
+        'sms': {
+            'enabled': False,
+            'provider': '',
+            'api_key': '',
+            'phone_numbers': []
+        }
     }
+}
 
-def get_demo_data(sensor_type, num_points=100):
-    """Generate demo data for a sensor type"""
+def get_default_config():
+    """Get default configuration.
+
+    Returns a deep copy so callers may mutate the result without
+    affecting the shared default.
+    """
+    return copy.deepcopy(_DEFAULT_CONFIG)
+
+@lru_cache(maxsize=64)
+def _demo_frame(sensor_type, num_points, bucket):
+    """Build the demo frame for one time bucket (see get_demo_data).
+
+    The PCG64 generator is seeded from the bucket so a recompute after
+    eviction yields the same frame a cache hit would have returned.
+    """
+    rng = np.random.default_rng(bucket)
     end_time = datetime.now()
     start_time = end_time - timedelta(hours=24)
-    
-    data = []
-    
-    # Generate data points at regular intervals
-    time_delta = (end_time - start_time) / num_points
-    current_time = start_time
-    
+
+    # One regular timestamp grid; hour and weekday come out as arrays so
+    # every branch below can draw all its values in bulk instead of
+    # looping point by point
+    times = pd.date_range(start_time, end_time, periods=num_points)
+    hour = times.hour.to_numpy()
+    weekday = times.weekday.to_numpy()
+
+    if sensor_type == 'temperature':
+        # Simulate temperature variations through the day
+        base = np.select(
+            [hour < 6, hour < 12, hour < 18],
+            [
+                18.0 + rng.uniform(-1, 1, num_points),
+                19.0 + (hour - 6) * 0.5 + rng.uniform(-0.5, 0.5, num_points),
+                22.0 + rng.uniform(-0.5, 0.5, num_points),
+            ],
+            22.0 - (hour - 18) * 0.5 + rng.uniform(-0.5, 0.5, num_points)
+        )
+        values = np.round(base, 1)
+        unit = '°C'
+
+    elif sensor_type == 'humidity':
+        # Simulate humidity variations: each time of day has its own band
+        lo = np.select([hour < 6, hour < 12, hour < 18], [40.0, 45.0, 30.0], 40.0)
+        hi = np.select([hour < 6, hour < 12, hour < 18], [50.0, 60.0, 50.0], 55.0)
+        values = np.round(rng.uniform(lo, hi), 1)
+        unit = '%'
+
+    elif sensor_type == 'pressure':
+        # Simulate atmospheric pressure with a daily sinusoidal swing
+        daily_variation = 5.0 * np.sin(
+            2 * np.pi * np.arange(num_points) / num_points
+        )
+        values = np.round(
+            1013.0 + daily_variation + rng.uniform(-2, 2, num_points), 1
+        )
+        unit = 'hPa'
+
+    elif sensor_type == 'co2':
+        # Simulate CO2 levels, higher during working hours
+        work = (hour >= 8) & (hour <= 18)
+        values = np.round(
+            rng.uniform(
+                np.where(work, 600.0, 400.0), np.where(work, 1200.0, 600.0)
+            ),
+            0
+        )
+        unit = 'ppm'
+
+    elif sensor_type == 'light':
+        # Simulate light levels based on time of day
+        night = (hour < 6) | (hour >= 20)
+        twilight = ((hour >= 6) & (hour < 8)) | ((hour >= 18) & (hour < 20))
+        lo = np.select([night, twilight], [0.0, 50.0], 300.0)
+        hi = np.select([night, twilight], [10.0, 200.0], 1000.0)
+        values = np.round(rng.uniform(lo, hi), 0)
+        unit = 'lux'
+
+    elif sensor_type == 'motion':
+        # Motion is three times as likely during weekday working hours
+        busy = (weekday < 5) & (hour >= 8) & (hour <= 18)
+        p_motion = np.where(busy, 0.75, 0.25)
+        values = (rng.uniform(0, 1, num_points) < p_motion).astype(np.int64)
+        unit = 'binary'
+
+    elif sensor_type == 'occupancy':
+        # Simulate occupancy through the weekday arrival/lunch/departure
+        # rhythm; weekends and off hours stay near empty
+        day_phases = [
+            weekday >= 5, hour < 8, hour < 9, hour < 12,
+            hour < 13, hour < 17, hour < 18,
+        ]
+        lo = np.select(day_phases, [0, 0, 1, 5, 2, 5, 1], 0)
+        hi = np.select(day_phases, [2, 2, 10, 15, 8, 15, 5], 2)
+        values = rng.integers(lo, hi + 1)
+        unit = 'count'
+
+    else:
+        # Default random values
+        values = np.round(rng.uniform(0, 100, num_points), 1)
+        unit = 'value'
+
+    # Columnar result: the visualization helpers take DataFrames as-is,
+    # so nothing downstream pays to rebuild one from per-point dicts. The
+    # unit column is a single-category Categorical, stored once.
+    # Timestamps stay as datetimes: plotly takes them natively, so
+    # formatting them here would only force a reparse at chart time
+    return pd.DataFrame({
+        'timestamp': times,
+        'value': values,
+        'unit': pd.Categorical([unit] * num_points),
+    })
+
+def _collect_env_vars(config):
+    """Collect every env_var name referenced by the platform params"""
+    names = set()
+    for platform in config.get('platforms', {}).values():
+        for param_info in platform.get('connection_params', {}).values():
+            name = param_info.get('env_var')
+            if name:
+                names.add(name)
+    return names
+
+# Environment snapshot taken once at import: the connection forms read
+# these on every rerender, and each os.getenv call scans the process
+# environment, so repeated reads become plain dict lookups instead
+_ENV_SNAPSHOT = {
+    name: os.environ.get(name, '')
+    for name in _collect_env_vars(get_default_config())
+}
+
+def get_env(name, default=''):
+    """Read a connection env var from the import-time snapshot.
+
+    Names outside the snapshot fall back to a live os.environ read.
+    """
+    value = _ENV_SNAPSHOT.get(name)
+    if value is not None:
+        return value or default
+    return os.environ.get(name, default)
+
+def iter_demo_data(sensor_type, num_points=100):
+    """Yield demo records one at a time for memory-bound consumers.
+
+    Rows come from the same cached frame as get_demo_data but are
+    materialized lazily, so a caller that only reduces over the stream
+    never holds the full record list.
+    """
+    df = _demo_frame(sensor_type, num_points, int(time.time() // 3600))
+    if df.empty:
+        return
+    timestamps = df['timestamp'].to_numpy()
+    values = df['value'].to_numpy()
+    unit = df['unit'].iloc[0]
     for i in range(num_points):
-        timestamp = current_time.strftime("%Y-%m-%d %H:%M:%S")
-        
-        if sensor_type == 'temperature':
-            # Simulate temperature variations through the day
-            hour = current_time.hour
-            base_temp = 20.0
-            if hour < 6:  # Night
-                base_temp = 18.0 + random.uniform(-1, 1)
-            elif hour < 12:  # Morning
-                base_temp = 19.0 + (hour - 6) * 0.5 + random.uniform(-0.5, 0.5)
-            elif hour < 18:  # Afternoon
-                base_temp = 22.0 + random.uniform(-0.5, 0.5)
-            else:  # Evening
-                base_temp = 22.0 - (hour - 18) * 0.5 + random.uniform(-0.5, 0.5)
-            
-            value = round(base_temp, 1)
-            unit = '°C'
-        
-        elif sensor_type == 'humidity':
-            # Simulate humidity variations
-            hour = current_time.hour
-            if hour < 6:  # Night
-                value = round(random.uniform(40, 50), 1)
-            elif hour < 12:  # Morning
-                value = round(random.uniform(45, 60), 1)
-            elif hour < 18:  # Afternoon
-                value = round(random.uniform(30, 50), 1)
-            else:  # Evening
-                value = round(random.uniform(40, 55), 1)
-            
-            unit = '%'
-        
-        elif sensor_type == 'pressure':
-            # Simulate atmospheric pressure
-            base_pressure = 1013.0
-            daily_variation = 5.0 * math.sin(2 * math.pi * i / num_points)
-            random_variation = random.uniform(-2, 2)
-            value = round(base_pressure + daily_variation + random_variation, 1)
-            unit = 'hPa'
-        
-        elif sensor_type == 'co2':
-            # Simulate CO2 levels
-            hour = current_time.hour
-            if 8 <= hour <= 18:  # Working hours
-                value = round(random.uniform(600, 1200), 0)
-            else:  # Off hours
-                value = round(random.uniform(400, 600), 0)
-            
-            unit = 'ppm'
-        
-        elif sensor_type == 'light':
-            # Simulate light levels based on time of day
-            hour = current_time.hour
-            if hour < 6 or hour >= 20:  # Night
-                value = round(random.uniform(0, 10), 0)
-            elif 6 <= hour < 8 or 18 <= hour < 20:  # Dawn/Dusk
-                value = round(random.uniform(50, 200), 0)
-            else:  # Daytime
-                value = round(random.uniform(300, 1000), 0)
-            
-            unit = 'lux'
-        
-        elif sensor_type == 'motion':
-            # Simulate motion detection
-            hour = current_time.hour
-            weekday = current_time.weekday()
-            
-            if weekday < 5 and 8 <= hour <= 18:  # Weekday working hours
-                value = random.choice([0, 1, 1, 1])  # More likely to have motion
-            else:  # Weekend or off hours
-                value = random.choice([0, 0, 0, 1])  # Less likely to have motion
-            
-            unit = 'binary'
-        
-        elif sensor_type == 'occupancy':
-            # Simulate occupancy
-            hour = current_time.hour
-            weekday = current_time.weekday()
-            
-            if weekday < 5:  # Weekday
-                if 8 <= hour < 9:  # Arrival time
-                    value = random.randint(1, 10)
-                elif 9 <= hour < 12:  # Morning work
-                    value = random.randint(5, 15)
-                elif 12 <= hour < 13:  # Lunch
-                    value = random.randint(2, 8)
-                elif 13 <= hour < 17:  # Afternoon work
-                    value = random.randint(5, 15)
-                elif 17 <= hour < 18:  # Departure time
-                    value = random.randint(1, 5)
-                else:  # Off hours
-                    value = random.randint(0, 2)
-            else:  # Weekend
-                value = random.randint(0, 2)
-            
-            unit = 'count'
-        
-        else:
-            # Default random value
-            value = round(random.uniform(0, 100), 1)
-            unit = 'value'
-        
-        data.append({
-            'timestamp': timestamp,
-            'value': value,
+        yield {
+            'timestamp': timestamps[i],
+            'value': values[i].item(),
             'unit': unit
-        })
-        
-        current_time += time_delta
-    
-    return data
+        }
+
+def streaming_stats(records):
+    """Reduce an iterable of records (or bare values) in a single pass.
+
+    Keeps O(1) state — count, sum, min, max — instead of materializing
+    the stream, and returns a dict with min/max/avg/count.
+    """
+    count = 0
+    total = 0.0
+    minimum = math.inf
+    maximum = -math.inf
+    for record in records:
+        value = record['value'] if isinstance(record, dict) else record
+        count += 1
+        total += value
+        if value < minimum:
+            minimum = value
+        if value > maximum:
+            maximum = value
+    if not count:
+        return {'min': None, 'max': None, 'avg': None, 'count': 0}
+    return {
+        'min': minimum,
+        'max': maximum,
+        'avg': total / count,
+        'count': count
+    }
+
+def get_demo_data(sensor_type, num_points=100):
+    """Generate demo data for a sensor type as a columnar DataFrame.
+
+    Frames are memoized per (sensor_type, num_points, hour), so the
+    repeated Streamlit reruns within an hour reuse the cached frame
+    instead of regenerating it. Callers get a copy they may mutate.
+    """
+    bucket = int(time.time() // 3600)
+    return _demo_frame(sensor_type, num_points, bucket).copy()
 
 import math
 
+# Radius of the Earth in kilometers
+_EARTH_RADIUS_KM = 6371.0
+
 def calculate_distance(lat1, lon1, lat2, lon2):
     """Calculate distance between two GPS coordinates in kilometers"""
-    # Radius of the Earth in kilometers
-    R = 6371.0
+    R = _EARTH_RADIUS_KM
     
     # Convert coordinates from degrees to radians
     lat1_rad = math.radians(lat1)
@@ -364,6 +508,27 @@ def calculate_distance(lat1, lon1, lat2, lon2):
     
     return distance
 
+def calculate_distance_batch(lat1, lon1, lats, lons):
+    """Distances in kilometers from one point to many GPS coordinates.
+
+    Vectorized haversine: one pass of array trig covers every coordinate,
+    and arcsin(sqrt(a)) replaces atan2(sqrt(a), sqrt(1 - a)) — equivalent
+    for the haversine's 0 <= a <= 1 but with half the square roots.
+    """
+    lat1_rad = math.radians(lat1)
+    lon1_rad = math.radians(lon1)
+    lats_rad = np.deg2rad(lats)
+    lons_rad = np.deg2rad(lons)
+    
+    dlat = lats_rad - lat1_rad
+    dlon = lons_rad - lon1_rad
+    
+    a = (
+        np.sin(dlat / 2)**2
+        + math.cos(lat1_rad) * np.cos(lats_rad) * np.sin(dlon / 2)**2
+    )
+    return 2 * _EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+
 def format_value(value, sensor_type, precision=1):
     """Format a sensor value based on its type"""
     if sensor_type in ['temperature', 'humidity', 'pressure']:
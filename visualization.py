@@ -3,35 +3,103 @@ import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 import numpy as np
+import types
 from datetime import datetime
 
+from utils import streaming_stats
+
+# Layout fragments shared by every chart, built once; plotly copies what
+# it needs, so a single module-level dict can serve all renders
+_DEFAULT_MARGIN = dict(l=20, r=20, t=40, b=20)
+_LINE_LAYOUT = dict(height=400, margin=_DEFAULT_MARGIN, hovermode="x unified")
+_CHART_LAYOUT = dict(height=400, margin=_DEFAULT_MARGIN)
+_HEATMAP_LAYOUT = dict(height=500, margin=_DEFAULT_MARGIN)
+_GAUGE_LAYOUT = dict(height=300, margin=dict(l=20, r=20, t=50, b=20))
+
+# Per-sensor-type display constants, built once at module load instead of
+# on every chart render
+_UNIT_BY_TYPE = {
+    'temperature': '°C',
+    'humidity': '%',
+    'pressure': 'hPa',
+    'co2': 'ppm',
+    'light': 'lux',
+    'motion': 'activity',
+    'occupancy': 'count'
+}
+
+def _gauge_steps(bands):
+    """Build the final gauge step dicts for a list of (min, max, color)"""
+    return [
+        dict(range=[lo, hi], color=color, thickness=0.75)
+        for lo, hi, color in bands
+    ]
+
+# Gauge spec per sensor type: (min, max, steps, title, default unit). The
+# step dicts are in their final plotly shape, so a render only looks them
+# up instead of rebuilding them
+_GAUGE_DEFAULT_SPEC = (
+    0, 100,
+    _gauge_steps([(0, 33, 'red'), (33, 66, 'yellow'), (66, 100, 'green')]),
+    None, ''
+)
+_GAUGE_SPEC_BY_TYPE = {
+    'temperature': (
+        0, 40,
+        _gauge_steps([(0, 15, 'blue'), (15, 25, 'green'), (25, 40, 'red')]),
+        'Temperature', '°C'
+    ),
+    'humidity': (
+        0, 100,
+        _gauge_steps([(0, 30, 'yellow'), (30, 70, 'green'), (70, 100, 'blue')]),
+        'Humidity', '%'
+    ),
+    'pressure': (
+        900, 1100,
+        _gauge_steps([(900, 970, 'red'), (970, 1030, 'green'), (1030, 1100, 'red')]),
+        'Pressure', 'hPa'
+    ),
+}
+
+def _coerce_df(data):
+    """Return the input as a DataFrame without needless reconstruction.
+
+    DataFrames pass through untouched. Lists of sensor records (the
+    timestamp/value/unit shape) go through from_records with fixed
+    columns, skipping pandas' per-column type inference; anything else
+    falls back to the generic constructor.
+    """
+    if isinstance(data, pd.DataFrame):
+        return data
+    if (
+        isinstance(data, list) and data
+        and isinstance(data[0], dict)
+        and 'timestamp' in data[0]
+        and 'value' in data[0]
+        and 'unit' in data[0]
+    ):
+        return pd.DataFrame.from_records(
+            data, columns=('timestamp', 'value', 'unit')
+        )
+    return pd.DataFrame(data)
+
+
 def create_line_chart(data, sensor_type=None):
     """Create a line chart for sensor data"""
-    # Convert to DataFrame if it's a list of dictionaries
-    if isinstance(data, list):
-        df = pd.DataFrame(data)
-    else:
-        df = data
+    df = _coerce_df(data)
     
-    # Ensure timestamp is properly formatted
+    # Demo and platform data already carry datetime timestamps, so this
+    # O(1) dtype guard only converts for stragglers that still pass
+    # formatted strings (e.g. database exports)
     if 'timestamp' in df.columns:
-        if isinstance(df['timestamp'].iloc[0], str):
-            df['timestamp'] = pd.to_datetime(df['timestamp'])
+        if not pd.api.types.is_datetime64_any_dtype(df['timestamp']):
+            df = df.assign(timestamp=pd.to_datetime(df['timestamp']))
     
     # Determine y-axis label based on sensor type and unit
     if 'unit' in df.columns:
         y_label = f"Value ({df['unit'].iloc[0]})"
     elif sensor_type:
-        units = {
-            'temperature': '°C',
-            'humidity': '%',
-            'pressure': 'hPa',
-            'co2': 'ppm',
-            'light': 'lux',
-            'motion': 'activity',
-            'occupancy': 'count'
-        }
-        y_label = f"{sensor_type.capitalize()} ({units.get(sensor_type, 'value')})"
+        y_label = f"{sensor_type.capitalize()} ({_UNIT_BY_TYPE.get(sensor_type, 'value')})"
     else:
         y_label = "Value"
     
@@ -45,11 +113,7 @@ def create_line_chart(data, sensor_type=None):
     )
     
     # Customize the chart
-    fig.update_layout(
-        height=400,
-        margin=dict(l=20, r=20, t=40, b=20),
-        hovermode="x unified"
-    )
+    fig.update_layout(**_LINE_LAYOUT)
     
     # Display the chart
     st.plotly_chart(fig, use_container_width=True)
@@ -66,56 +130,13 @@ def create_gauge_chart(data, sensor_type=None):
         value = data
         unit = ''
     
-    # Define ranges based on sensor type
-    if sensor_type == 'temperature':
-        min_val, max_val = 0, 40
-        thresholds = [
-            {'min': 0, 'max': 15, 'color': 'blue'},
-            {'min': 15, 'max': 25, 'color': 'green'},
-            {'min': 25, 'max': 40, 'color': 'red'}
-        ]
-        title = 'Temperature'
-        if not unit:
-            unit = '°C'
-    elif sensor_type == 'humidity':
-        min_val, max_val = 0, 100
-        thresholds = [
-            {'min': 0, 'max': 30, 'color': 'yellow'},
-            {'min': 30, 'max': 70, 'color': 'green'},
-            {'min': 70, 'max': 100, 'color': 'blue'}
-        ]
-        title = 'Humidity'
-        if not unit:
-            unit = '%'
-    elif sensor_type == 'pressure':
-        min_val, max_val = 900, 1100
-        thresholds = [
-            {'min': 900, 'max': 970, 'color': 'red'},
-            {'min': 970, 'max': 1030, 'color': 'green'},
-            {'min': 1030, 'max': 1100, 'color': 'red'}
-        ]
-        title = 'Pressure'
-        if not unit:
-            unit = 'hPa'
-    else:
-        min_val, max_val = 0, 100
-        thresholds = [
-            {'min': 0, 'max': 33, 'color': 'red'},
-            {'min': 33, 'max': 66, 'color': 'yellow'},
-            {'min': 66, 'max': 100, 'color': 'green'}
-        ]
+    # Look up the prebuilt spec for this sensor type
+    spec = _GAUGE_SPEC_BY_TYPE.get(sensor_type, _GAUGE_DEFAULT_SPEC)
+    min_val, max_val, steps, title, default_unit = spec
+    if title is None:
         title = sensor_type.capitalize() if sensor_type else 'Value'
-    
-    # Create steps for gauge chart
-    steps = []
-    for threshold in thresholds:
-        steps.append(
-            dict(
-                range=[threshold['min'], threshold['max']],
-                color=threshold['color'],
-                thickness=0.75
-            )
-        )
+    if not unit:
+        unit = default_unit
     
     # Create the gauge chart
     fig = go.Figure(go.Indicator(
@@ -138,10 +159,7 @@ def create_gauge_chart(data, sensor_type=None):
         }
     ))
     
-    fig.update_layout(
-        height=300,
-        margin=dict(l=20, r=20, t=50, b=20)
-    )
+    fig.update_layout(**_GAUGE_LAYOUT)
     
     # Display the chart
     st.plotly_chart(fig, use_container_width=True)
@@ -151,11 +169,7 @@ def create_gauge_chart(data, sensor_type=None):
 
 def create_bar_chart(data, x_column, y_column, title=None):
     """Create a bar chart from data"""
-    # Convert to DataFrame if it's a list of dictionaries
-    if isinstance(data, list):
-        df = pd.DataFrame(data)
-    else:
-        df = data
+    df = _coerce_df(data)
     
     # Create the bar chart
     fig = px.bar(
@@ -166,10 +180,7 @@ def create_bar_chart(data, x_column, y_column, title=None):
     )
     
     # Customize the chart
-    fig.update_layout(
-        height=400,
-        margin=dict(l=20, r=20, t=40, b=20)
-    )
+    fig.update_layout(**_CHART_LAYOUT)
     
     # Display the chart
     st.plotly_chart(fig, use_container_width=True)
@@ -177,45 +188,60 @@ def create_bar_chart(data, x_column, y_column, title=None):
     return fig
 
 
+def _fmt_stat(value):
+    """Format one summary stat: integers (Count) verbatim, floats to
+    two decimals"""
+    return str(value) if isinstance(value, int) else f"{value:.2f}"
+
+
 def create_stats_summary(data, columns=None):
     """Create a statistical summary display"""
-    # Convert to DataFrame if it's a list of dictionaries
-    if isinstance(data, list):
-        df = pd.DataFrame(data)
+    if isinstance(data, types.GeneratorType):
+        # Streaming input: reduce in one pass with O(1) memory. An exact
+        # median would need the whole column, so this path shows the
+        # sample count in its place.
+        s = streaming_stats(data)
+        if not s['count']:
+            # An exhausted stream has nothing to format
+            st.info("No data available for summary")
+            return {'Min': None, 'Max': None, 'Average': None, 'Count': 0}
+        stats = {
+            'Min': s['min'],
+            'Max': s['max'],
+            'Average': s['avg'],
+            'Count': s['count']
+        }
     else:
-        df = data
-    
-    # Calculate statistics
-    stats = {
-        'Min': df['value'].min(),
-        'Max': df['value'].max(),
-        'Average': df['value'].mean(),
-        'Median': df['value'].median()
-    }
+        df = _coerce_df(data)
+
+        # Calculate all four statistics in one pass over the column
+        agg = df['value'].agg(['min', 'max', 'mean', 'median'])
+        stats = {
+            'Min': agg['min'],
+            'Max': agg['max'],
+            'Average': agg['mean'],
+            'Median': agg['median']
+        }
     
     # If columns are provided, display in those columns
     if columns:
         for i, (stat_name, stat_value) in enumerate(stats.items()):
             if i < len(columns):
                 with columns[i]:
-                    st.metric(label=stat_name, value=f"{stat_value:.2f}")
+                    st.metric(label=stat_name, value=_fmt_stat(stat_value))
     else:
         # Otherwise create a new set of columns
         cols = st.columns(len(stats))
         for i, (stat_name, stat_value) in enumerate(stats.items()):
             with cols[i]:
-                st.metric(label=stat_name, value=f"{stat_value:.2f}")
+                st.metric(label=stat_name, value=_fmt_stat(stat_value))
     
     return stats
 
 
 def create_heatmap(data, x_column, y_column, value_column, title=None):
     """Create a heatmap from data"""
-    # Convert to DataFrame if it's a list of dictionaries
-    if isinstance(data, list):
-        df = pd.DataFrame(data)
-    else:
-        df = data
+    df = _coerce_df(data)
     
     # Create the heatmap
     fig = px.density_heatmap(
@@ -227,10 +253,7 @@ def create_heatmap(data, x_column, y_column, value_column, title=None):
     )
     
     # Customize the chart
-    fig.update_layout(
-        height=500,
-        margin=dict(l=20, r=20, t=40, b=20)
-    )
+    fig.update_layout(**_HEATMAP_LAYOUT)
     
     # Display the chart
     st.plotly_chart(fig, use_container_width=True)
@@ -240,11 +263,7 @@ def create_heatmap(data, x_column, y_column, value_column, title=None):
 
 def create_scatter_plot(data, x_column, y_column, color_column=None, title=None):
     """Create a scatter plot from data"""
-    # Convert to DataFrame if it's a list of dictionaries
-    if isinstance(data, list):
-        df = pd.DataFrame(data)
-    else:
-        df = data
+    df = _coerce_df(data)
     
     # Create the scatter plot
     fig = px.scatter(
@@ -256,10 +275,7 @@ def create_scatter_plot(data, x_column, y_column, color_column=None, title=None)
     )
     
     # Customize the chart
-    fig.update_layout(
-        height=400,
-        margin=dict(l=20, r=20, t=40, b=20)
-    )
+    fig.update_layout(**_CHART_LAYOUT)
     
     # Display the chart
     st.plotly_chart(fig, use_container_width=True)